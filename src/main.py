@@ -1,10 +1,12 @@
 """Main application entry point."""
 
+import argparse
 import asyncio
+import functools
 import logging
 import os
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Sequence
 
 import uvicorn
 from dotenv import load_dotenv
@@ -15,21 +17,24 @@ from src.bot import create_bot_app
 from src.services.logging import setup_server_logging
 
 
-def _load_environment() -> None:
+def _load_environment(candidates: Sequence[Path] = (Path("/tmp/.sosenki-env"),)) -> None:
     """Load environment variables from .env and dynamic sources.
 
     Priority:
     1. .env (static configuration - single source of truth)
     2. /tmp/.sosenki-env (dynamic values from setup-environment.sh)
     3. OS environment variables
+
+    Args:
+        candidates: Dynamic env files loaded in order over .env, skipped if missing
     """
     # Load static config from .env
     load_dotenv()
 
     # Load dynamic environment if it exists (generated by setup-environment.sh)
-    temp_env_file = Path("/tmp/.sosenki-env")
-    if temp_env_file.exists():
-        load_dotenv(temp_env_file, override=True)
+    for env_file in candidates:
+        if env_file.exists():
+            load_dotenv(env_file, override=True)
 
 
 def _validate_environment() -> None:
@@ -71,6 +76,16 @@ async def initialize_bot() -> None:
     logger.info("Bot initialized successfully")
 
 
+async def _on_shutdown(bot_app: Optional[Application]) -> None:
+    """Shut down the bot Application when the FastAPI app stops."""
+    if bot_app:
+        try:
+            await bot_app.shutdown()
+            logger.info("Bot Application shutdown complete")
+        except Exception as e:
+            logger.error(f"Error shutting down bot: {e}")
+
+
 async def run_webhook_mode(host: str = "0.0.0.0", port: int = 8000):
     """Run application in webhook mode (production)."""
     logger.info(f"Starting bot in webhook mode on {host}:{port}")
@@ -101,17 +116,8 @@ async def run_webhook_mode(host: str = "0.0.0.0", port: int = 8000):
     else:
         logger.warning("WEBHOOK_URL not set in environment")
 
-    async def shutdown_bot():
-        global bot_app
-        if bot_app:
-            try:
-                await bot_app.shutdown()
-                logger.info("Bot Application shutdown complete")
-            except Exception as e:
-                logger.error(f"Error shutting down bot: {e}")
-
     # Register shutdown with FastAPI
-    app.add_event_handler("shutdown", shutdown_bot)
+    app.add_event_handler("shutdown", functools.partial(_on_shutdown, bot_app))
 
     logger.info(f"Starting Uvicorn server on {host}:{port}...")
     config = uvicorn.Config(
@@ -125,17 +131,8 @@ async def run_webhook_mode(host: str = "0.0.0.0", port: int = 8000):
     await server.serve()
 
 
-def main():
-    """Main entry point."""
-    import argparse
-
-    # Get port from environment (required)
-    port_env = os.getenv("PORT")
-    if not port_env:
-        logger.critical("PORT not set in environment. Check .env file.")
-        raise RuntimeError("PORT environment variable is required")
-    default_port = int(port_env)
-
+def _build_parser(default_port: int = 8000) -> argparse.ArgumentParser:
+    """Build the command line parser for the entry point."""
     parser = argparse.ArgumentParser(description="SOSenki Bot")
     parser.add_argument(
         "--mode",
@@ -145,8 +142,19 @@ def main():
     )
     parser.add_argument("--host", default="0.0.0.0", help="Host to bind to")
     parser.add_argument("--port", type=int, default=default_port, help="Port to bind to")
+    return parser
+
+
+def main():
+    """Main entry point."""
+    # Get port from environment (required)
+    port_env = os.getenv("PORT")
+    if not port_env:
+        logger.critical("PORT not set in environment. Check .env file.")
+        raise RuntimeError("PORT environment variable is required")
+    default_port = int(port_env)
 
-    args = parser.parse_args()
+    args = _build_parser(default_port).parse_args()
 
     # Only webhook mode is supported (mini app requires HTTP)
     try:
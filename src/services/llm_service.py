@@ -239,6 +239,23 @@ async def execute_tool(
     Returns:
         JSON string with tool result or error
     """
+    result = await _execute_tool_dict(tool_name, arguments, ctx)
+    try:
+        return json.dumps(result)
+    except (TypeError, ValueError) as e:
+        logger.error(f"Tool result serialization error ({tool_name}): {e}", exc_info=True)
+        return json.dumps({"error": str(e)})
+
+
+async def _execute_tool_dict(
+    tool_name: str,
+    arguments: dict[str, Any],
+    ctx: ToolContext,
+) -> dict[str, Any]:
+    """Execute a tool and return the result as a JSON-serializable dict.
+
+    Same dispatch and error handling as execute_tool, without the final encode.
+    """
     try:
         if tool_name == "get_balance":
             return await _execute_get_balance(ctx)
@@ -248,18 +265,18 @@ async def execute_tool(
         elif tool_name == "get_period_info":
             period_id = arguments.get("period_id")
             if not period_id:
-                return json.dumps({"error": "period_id is required"})
+                return {"error": "period_id is required"}
             return await _execute_get_period_info(ctx, period_id)
         elif tool_name == "create_service_period":
             if not ctx.is_admin:
-                return json.dumps({"error": "Admin access required for this operation"})
+                return {"error": "Admin access required for this operation"}
             name = arguments.get("name", "")
             start_date = arguments.get("start_date", "")
             end_date = arguments.get("end_date", "")
             return await _execute_create_service_period(ctx, name, start_date, end_date)
         elif tool_name == "create_transaction":
             if not ctx.is_admin:
-                return json.dumps({"error": "Admin access required for this operation"})
+                return {"error": "Admin access required for this operation"}
             from_account_id = arguments.get("from_account_id")
             to_account_id = arguments.get("to_account_id")
             amount = arguments.get("amount")
@@ -274,82 +291,74 @@ async def execute_tool(
                 transaction_date=transaction_date,
             )
         else:
-            return json.dumps({"error": f"Unknown tool: {tool_name}"})
+            return {"error": f"Unknown tool: {tool_name}"}
     except Exception as e:
         logger.error(f"Tool execution error ({tool_name}): {e}", exc_info=True)
-        return json.dumps({"error": str(e)})
+        return {"error": str(e)}
 
 
-async def _execute_get_balance(ctx: ToolContext) -> str:
+async def _execute_get_balance(ctx: ToolContext) -> dict[str, Any]:
     """Execute get_balance tool."""
     service = BalanceCalculationService(ctx.session)
 
     user = await service.get_user_by_id(ctx.user_id)
     if not user:
-        return json.dumps({"error": f"User {ctx.user_id} not found"})
+        return {"error": f"User {ctx.user_id} not found"}
 
     account = await service.get_account_for_user(ctx.user_id)
     if not account:
-        return json.dumps({"error": f"No account found for user {ctx.user_id}"})
+        return {"error": f"No account found for user {ctx.user_id}"}
 
     balance = await service.calculate_user_balance(ctx.user_id)
 
-    return json.dumps(
-        {
-            "user_id": ctx.user_id,
-            "user_name": user.name,
-            "balance": float(balance),
-            "currency": CURRENCY,
-            "last_updated": (
-                format_local_datetime(account.updated_at) if account.updated_at else None
-            ),
-        }
-    )
+    return {
+        "user_id": ctx.user_id,
+        "user_name": user.name,
+        "balance": float(balance),
+        "currency": CURRENCY,
+        "last_updated": (format_local_datetime(account.updated_at) if account.updated_at else None),
+    }
 
 
-async def _execute_list_bills(ctx: ToolContext, limit: int) -> str:
+async def _execute_list_bills(ctx: ToolContext, limit: int) -> dict[str, Any]:
     """Execute list_bills tool."""
     service = BalanceCalculationService(ctx.session)
 
     account = await service.get_account_for_user(ctx.user_id)
     if not account:
-        return json.dumps({"error": f"No account found for user {ctx.user_id}"})
+        return {"error": f"No account found for user {ctx.user_id}"}
 
     bills = await service.list_bills_for_user(ctx.user_id, limit)
 
-    return json.dumps(
-        {
-            "user_id": ctx.user_id,
-            "bills": [
-                {
-                    "bill_id": bill.bill_id,
-                    "amount": bill.amount,
-                    "bill_date": bill.bill_date,
-                    "bill_type": bill.bill_type,
-                }
-                for bill in bills
-            ],
-        }
-    )
+    return {
+        "user_id": ctx.user_id,
+        "bills": [
+            {
+                "bill_id": bill.bill_id,
+                "amount": bill.amount,
+                "bill_date": bill.bill_date,
+                "bill_type": bill.bill_type,
+            }
+            for bill in bills
+        ],
+    }
 
 
-async def _execute_get_period_info(ctx: ToolContext, period_id: int) -> str:
+async def _execute_get_period_info(ctx: ToolContext, period_id: int) -> dict[str, Any]:
     """Execute get_period_info tool."""
     service = AsyncServicePeriodService(ctx.session)
     period_info = await service.get_period_info(period_id)
 
     if not period_info:
-        return json.dumps({"error": f"Period {period_id} not found"})
-
-    return json.dumps(
-        {
-            "period_id": period_info.period_id,
-            "name": period_info.name,
-            "start_date": period_info.start_date,
-            "end_date": period_info.end_date,
-            "active": period_info.is_active,
-        }
-    )
+        return {"error": f"Period {period_id} not found"}
+
+    return {
+        "period_id": period_info.period_id,
+        "name": period_info.name,
+        "start_date": period_info.start_date,
+        "end_date": period_info.end_date,
+        "active": period_info.is_active,
+    }
 
 
 async def _execute_create_service_period(
@@ -357,7 +366,7 @@ async def _execute_create_service_period(
     name: str,
     start_date: str,
     end_date: str,
-) -> str:
+) -> dict[str, Any]:
     """Execute create_service_period tool (admin only)."""
     from datetime import date
 
@@ -365,22 +374,20 @@ async def _execute_create_service_period(
         start = date.fromisoformat(start_date)
         end = date.fromisoformat(end_date)
     except ValueError as e:
-        return json.dumps({"error": f"Invalid date format: {e}. Use YYYY-MM-DD."})
+        return {"error": f"Invalid date format: {e}. Use YYYY-MM-DD."}
 
     service = AsyncServicePeriodService(ctx.session)
     try:
         new_period = await service.create_period(start, end, name)
-        return json.dumps(
-            {
-                "success": True,
-                "period_id": new_period.id,
-                "name": new_period.name,
-                "start_date": new_period.start_date.isoformat(),
-                "end_date": new_period.end_date.isoformat(),
-            }
-        )
+        return {
+            "success": True,
+            "period_id": new_period.id,
+            "name": new_period.name,
+            "start_date": new_period.start_date.isoformat(),
+            "end_date": new_period.end_date.isoformat(),
+        }
     except ValueError as e:
-        return json.dumps({"error": str(e)})
+        return {"error": str(e)}
 
 
 async def _execute_create_transaction(
@@ -390,13 +397,13 @@ async def _execute_create_transaction(
     amount: float,
     description: str,
     transaction_date: str | None = None,
-) -> str:
+) -> dict[str, Any]:
     """Execute create_transaction tool (admin only)."""
     if not from_account_id or not to_account_id:
-        return json.dumps({"error": "Both from_account_id and to_account_id are required"})
+        return {"error": "Both from_account_id and to_account_id are required"}
 
     if not amount or amount <= 0:
-        return json.dumps({"error": "Amount must be positive"})
+        return {"error": "Amount must be positive"}
 
     try:
         service = TransactionService(ctx.session)
@@ -404,11 +411,11 @@ async def _execute_create_transaction(
         # Validate accounts exist
         from_account = await service.get_account_by_id(from_account_id)
         if not from_account:
-            return json.dumps({"error": f"From account {from_account_id} not found"})
+            return {"error": f"From account {from_account_id} not found"}
 
         to_account = await service.get_account_by_id(to_account_id)
         if not to_account:
-            return json.dumps({"error": f"To account {to_account_id} not found"})
+            return {"error": f"To account {to_account_id} not found"}
 
         # Create transaction
         from decimal import Decimal
@@ -418,7 +425,7 @@ async def _execute_create_transaction(
             try:
                 parsed_transaction_date = _parse_transaction_date(transaction_date)
             except ValueError as exc:  # pragma: no cover - input validation path
-                return json.dumps({"error": str(exc)})
+                return {"error": str(exc)}
 
         transaction = await service.create_transaction(
             from_account_id=from_account_id,
@@ -428,22 +435,20 @@ async def _execute_create_transaction(
             transaction_date=parsed_transaction_date,
         )
 
-        return json.dumps(
-            {
-                "success": True,
-                "transaction_id": transaction.id,
-                "from_account_name": from_account.name,
-                "to_account_name": to_account.name,
-                "amount": float(transaction.amount),
-                "description": transaction.description,
-                "transaction_date": transaction.transaction_date.isoformat(),
-            }
-        )
+        return {
+            "success": True,
+            "transaction_id": transaction.id,
+            "from_account_name": from_account.name,
+            "to_account_name": to_account.name,
+            "amount": float(transaction.amount),
+            "description": transaction.description,
+            "transaction_date": transaction.transaction_date.isoformat(),
+        }
     except ValueError as e:
-        return json.dumps({"error": str(e)})
+        return {"error": str(e)}
     except Exception as e:
         logger.error(f"Error in _execute_create_transaction: {e}", exc_info=True)
-        return json.dumps({"error": str(e)})
+        return {"error": str(e)}
 
 
 class OllamaService:
@@ -1,7 +1,8 @@
 """Pytest configuration for tests - applies migrations automatically.
 
 Database Strategy for Unit/Integration Tests:
-- Uses: test_sosenki.db (isolated test database)
+- Uses: test_sosenki.db (isolated test database), test_sosenki_<worker>.db per
+  pytest-xdist worker so parallel workers never migrate the same file
 - Purpose: Unit and integration tests need fresh isolated database per run
 - Isolation: Each test suite gets clean schema with no production data
 - Note: For seeding/data integrity tests, see seeding/tests/conftest.py which uses sosenki.db
@@ -14,6 +15,7 @@ from datetime import date
 from pathlib import Path
 
 import pytest
+from sqlalchemy import event, insert
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.pool import StaticPool
 
@@ -24,7 +26,13 @@ logging_dir.mkdir(parents=True, exist_ok=True)
 
 # Set test database URL BEFORE any imports from src
 # This ensures the SessionLocal and engine use the test database
-os.environ["DATABASE_URL"] = "sqlite:///./test_sosenki.db"
+_xdist_worker = os.environ.get("PYTEST_XDIST_WORKER")
+TEST_DB_FILE_URL = (
+    f"sqlite:///./test_sosenki_{_xdist_worker}.db"
+    if _xdist_worker
+    else "sqlite:///./test_sosenki.db"
+)
+os.environ["DATABASE_URL"] = TEST_DB_FILE_URL
 
 # Set dummy test token for TELEGRAM_BOT_TOKEN (required by bot config validation)
 # This is only used for unit/contract tests that don't make actual API calls
@@ -40,30 +48,43 @@ os.environ["SEEDING_CONFIG_PATH"] = "seeding/config/seeding.json"
 # Get the project root directory
 project_root = Path(__file__).parent.parent
 
-# Apply migrations immediately on test startup
-try:
-    result = subprocess.run(
-        ["uv", "run", "alembic", "upgrade", "head"],
-        cwd=str(project_root),
-        capture_output=True,
-        text=True,
-        timeout=30,
-        env={**os.environ, "DATABASE_URL": "sqlite:///./test_sosenki.db"},
-    )
 
-    if result.returncode != 0:
-        print(
-            f"WARNING: Alembic migration failed with return code {result.returncode}",
-            file=sys.stderr,
+def _apply_migrations() -> None:
+    """Apply Alembic migrations to this process's test database."""
+    try:
+        result = subprocess.run(
+            ["uv", "run", "alembic", "upgrade", "head"],
+            cwd=str(project_root),
+            capture_output=True,
+            text=True,
+            timeout=30,
+            env={**os.environ, "DATABASE_URL": TEST_DB_FILE_URL},
         )
-        print("STDOUT:", result.stdout, file=sys.stderr)
-        print("STDERR:", result.stderr, file=sys.stderr)
-    else:
-        print("✓ Applied migrations to test database", file=sys.stderr)
-except subprocess.TimeoutExpired:
-    print("WARNING: Alembic migration timed out", file=sys.stderr)
-except Exception as e:
-    print(f"WARNING: Failed to apply migrations: {e}", file=sys.stderr)
+
+        if result.returncode != 0:
+            print(
+                f"WARNING: Alembic migration failed with return code {result.returncode}",
+                file=sys.stderr,
+            )
+            print("STDOUT:", result.stdout, file=sys.stderr)
+            print("STDERR:", result.stderr, file=sys.stderr)
+        else:
+            print("✓ Applied migrations to test database", file=sys.stderr)
+    except subprocess.TimeoutExpired:
+        print("WARNING: Alembic migration timed out", file=sys.stderr)
+    except Exception as e:
+        print(f"WARNING: Failed to apply migrations: {e}", file=sys.stderr)
+
+
+def pytest_configure(config):
+    """Apply migrations on test startup.
+
+    Skipped in the pytest-xdist controller: it runs no tests, and each worker
+    migrates its own database file.
+    """
+    if getattr(config.option, "numprocesses", None) and not hasattr(config, "workerinput"):
+        return
+    _apply_migrations()
 
 
 # NOW safe to import from src (after env vars set)
@@ -72,17 +93,32 @@ from src.models.account import Account  # noqa: E402
 from src.models.service_period import ServicePeriod  # noqa: E402
 from src.models.user import User  # noqa: E402
 
+# In-memory SQLite for async service tests: no disk I/O, and StaticPool keeps
+# the single connection (and therefore the schema) alive for the engine lifetime
+TEST_DATABASE_URL = "sqlite+aiosqlite:///:memory:"
+
+# Stub period referenced by tests that hardcode service_period_id=1 on bills
+STUB_SERVICE_PERIOD_ID = 1
+
 
 @pytest.fixture
 async def async_engine():
     """Create an async test database engine."""
     engine = create_async_engine(
-        "sqlite+aiosqlite:///:memory:",
+        TEST_DATABASE_URL,
         connect_args={"check_same_thread": False},
         poolclass=StaticPool,
     )
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
+        await conn.execute(
+            insert(ServicePeriod).values(
+                id=STUB_SERVICE_PERIOD_ID,
+                name="stub-period",
+                start_date=date(2024, 1, 1),
+                end_date=date(2024, 12, 31),
+            )
+        )
     yield engine
     await engine.dispose()
 
@@ -97,38 +133,104 @@ async def session(async_engine):
         yield session
 
 
+@pytest.fixture(scope="session")
+async def shared_async_engine():
+    """Create one schema-only in-memory engine shared by the whole test session.
+
+    Building the metadata DDL and opening aiosqlite dominates the cost of small
+    service tests, so tests that only need a clean schema borrow this engine
+    through ``savepoint_session`` instead of creating their own. StaticPool hands
+    every checkout the same aiosqlite connection, so it is opened once per session
+    and its page cache stays warm; a multi-connection pool would give each
+    connection its own empty ``:memory:`` database.
+    """
+    # Explicit compiled-statement cache size for this engine; the engine lives for
+    # the whole session, so statements compiled by one test are reused by the next
+    engine = create_async_engine(TEST_DATABASE_URL, poolclass=StaticPool, query_cache_size=1200)
+
+    @event.listens_for(engine.sync_engine, "connect")
+    def _disable_driver_transactions(dbapi_connection, connection_record):
+        # pysqlite's own transaction handling defers BEGIN and breaks SAVEPOINT
+        # rollback, so let SQLAlchemy emit BEGIN itself
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(engine.sync_engine, "begin")
+    def _emit_begin(conn):
+        conn.exec_driver_sql("BEGIN")
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    yield engine
+    await engine.dispose()
+
+
 @pytest.fixture
-async def sample_user(session: AsyncSession):
+async def savepoint_session(shared_async_engine):
+    """Yield a session whose writes are rolled back when the test ends.
+
+    The session joins an outer transaction on the shared engine and turns its
+    own commits into SAVEPOINT releases, so rows never outlive the test.
+    """
+    async with shared_async_engine.connect() as conn:
+        trans = await conn.begin()
+        session = AsyncSession(
+            bind=conn, join_transaction_mode="create_savepoint", expire_on_commit=False
+        )
+        try:
+            yield session
+        finally:
+            await session.close()
+            await trans.rollback()
+
+
+@pytest.fixture
+def user_factory(session: AsyncSession):
+    """Return a factory that inserts users into this test's own database.
+
+    Function-scoped and backed by the per-test in-memory engine, so tests stay
+    independent under pytest-xdist workers (no shared rows or ids).
+    """
+
+    async def make_user(name: str, telegram_id: str) -> User:
+        user = User(name=name, telegram_id=telegram_id, is_active=True)
+        session.add(user)
+        await session.commit()
+        await session.refresh(user)
+        return user
+
+    return make_user
+
+
+@pytest.fixture
+def account_factory(session: AsyncSession):
+    """Return a factory that inserts user accounts into this test's own database."""
+
+    async def make_account(user: User, name: str = "Test Account") -> Account:
+        account = Account(name=name, user_id=user.id, account_type="user")
+        session.add(account)
+        await session.commit()
+        await session.refresh(account)
+        return account
+
+    return make_account
+
+
+@pytest.fixture
+async def sample_user(user_factory):
     """Create a sample user for tests."""
-    user = User(name="Test User", telegram_id="123456789", is_active=True)
-    session.add(user)
-    await session.commit()
-    await session.refresh(user)
-    return user
+    return await user_factory("Test User", "123456789")
 
 
 @pytest.fixture
-async def another_user(session: AsyncSession):
+async def another_user(user_factory):
     """Create another sample user for tests."""
-    user = User(name="Another User", telegram_id="987654321", is_active=True)
-    session.add(user)
-    await session.commit()
-    await session.refresh(user)
-    return user
+    return await user_factory("Another User", "987654321")
 
 
 @pytest.fixture
-async def sample_account(session: AsyncSession, sample_user: User):
+async def sample_account(account_factory, sample_user: User):
     """Create a sample account for tests."""
-    account = Account(
-        name="Test Account",
-        user_id=sample_user.id,
-        account_type="user",
-    )
-    session.add(account)
-    await session.commit()
-    await session.refresh(account)
-    return account
+    return await account_factory(sample_user)
 
 
 @pytest.fixture
@@ -3,7 +3,6 @@
 from unittest.mock import MagicMock
 
 import pytest
-from sqlalchemy.orm import Session
 
 from src.models.user import User
 from src.services.admin_utils import get_admin_telegram_id, get_admin_user
@@ -12,7 +11,7 @@ from src.services.admin_utils import get_admin_telegram_id, get_admin_user
 @pytest.fixture
 def mock_db_session():
     """Create a mock database session."""
-    return MagicMock(spec=Session)
+    return MagicMock()
 
 
 class TestGetAdminTelegramId:
@@ -2,15 +2,12 @@
 
 from unittest.mock import AsyncMock, MagicMock
 
-import pytest
-
 from src.services.audit_service import AuditService
 
 
 class TestAuditService:
     """Tests for AuditService audit logging."""
 
-    @pytest.mark.asyncio
     async def test_audit_log_basic(self):
         """Test creating a basic audit log entry."""
         mock_session = AsyncMock()
@@ -24,14 +21,15 @@ class TestAuditService:
             action="create",
         )
 
-        assert audit.entity_type == "period"
-        assert audit.entity_id == 1
-        assert audit.action == "create"
-        assert audit.actor_id is None
-        assert audit.changes is None
+        assert (
+            audit.entity_type,
+            audit.entity_id,
+            audit.action,
+            audit.actor_id,
+            audit.changes,
+        ) == ("period", 1, "create", None, None)
         mock_session.add.assert_called_once_with(audit)
 
-    @pytest.mark.asyncio
     async def test_audit_log_with_actor(self):
         """Test creating audit log with actor_id."""
         mock_session = AsyncMock()
@@ -45,14 +43,15 @@ class TestAuditService:
             actor_id=5,
         )
 
-        assert audit.entity_type == "bill"
-        assert audit.entity_id == 42
-        assert audit.action == "update"
-        assert audit.actor_id == 5
-        assert audit.changes is None
+        assert (
+            audit.entity_type,
+            audit.entity_id,
+            audit.action,
+            audit.actor_id,
+            audit.changes,
+        ) == ("bill", 42, "update", 5, None)
         mock_session.add.assert_called_once_with(audit)
 
-    @pytest.mark.asyncio
     async def test_audit_log_with_changes(self):
         """Test creating audit log with changes dict."""
         mock_session = AsyncMock()
@@ -68,14 +67,15 @@ class TestAuditService:
             changes=changes,
         )
 
-        assert audit.entity_type == "bill"
-        assert audit.entity_id == 99
-        assert audit.action == "modify"
-        assert audit.actor_id == 3
-        assert audit.changes == changes
+        assert (
+            audit.entity_type,
+            audit.entity_id,
+            audit.action,
+            audit.actor_id,
+            audit.changes,
+        ) == ("bill", 99, "modify", 3, changes)
         mock_session.add.assert_called_once_with(audit)
 
-    @pytest.mark.asyncio
     async def test_audit_log_all_parameters(self):
         """Test audit log with all parameters specified."""
         mock_session = AsyncMock()
@@ -91,11 +91,13 @@ class TestAuditService:
             changes=changes,
         )
 
-        assert audit.entity_type == "period"
-        assert audit.entity_id == 7
-        assert audit.action == "close"
-        assert audit.actor_id == 2
-        assert audit.changes == changes
+        assert (
+            audit.entity_type,
+            audit.entity_id,
+            audit.action,
+            audit.actor_id,
+            audit.changes,
+        ) == ("period", 7, "close", 2, changes)
         mock_session.add.assert_called_once()
 
     def test_audit_service_exports(self):
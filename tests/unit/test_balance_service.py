@@ -16,6 +16,7 @@ Note: OWNER accounts display inverted values (use calculate_account_balance_with
 """
 
 from datetime import date
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -27,19 +28,25 @@ from src.models.user import User
 from src.services.balance_service import BalanceCalculationService
 
 
-@pytest.mark.asyncio
+@pytest.fixture
+def balance_service(session: AsyncSession) -> BalanceCalculationService:
+    """Balance service bound to the per-test session."""
+    return BalanceCalculationService(session)
+
+
 async def test_balance_zero_when_no_transactions_and_no_bills(
-    session: AsyncSession, sample_user: User
+    balance_service: BalanceCalculationService, sample_user: User
 ):
     """Test balance is 0 when user has no transactions or bills."""
-    service = BalanceCalculationService(session)
-    balance = await service.calculate_user_balance(sample_user.id)
+    balance = await balance_service.calculate_user_balance(sample_user.id)
     assert balance == 0.0
 
 
-@pytest.mark.asyncio
 async def test_user_balance_negative_when_payments_exceed_bills(
-    session: AsyncSession, sample_user: User, sample_account: Account
+    session: AsyncSession,
+    balance_service: BalanceCalculationService,
+    sample_user: User,
+    sample_account: Account,
 ):
     """Test user balance is negative (credit) when payments exceed bills.
 
@@ -80,15 +87,16 @@ async def test_user_balance_negative_when_payments_exceed_bills(
     session.add(bill)
     await session.commit()
 
-    service = BalanceCalculationService(session)
-    balance = await service.calculate_user_balance(sample_user.id)
+    balance = await balance_service.calculate_user_balance(sample_user.id)
     # Balance = 0 (incoming) - 200 (outgoing) + 150 (bills) = -50 (credit)
     assert balance == -50.0
 
 
-@pytest.mark.asyncio
 async def test_user_balance_positive_when_bills_exceed_payments(
-    session: AsyncSession, sample_user: User, sample_account: Account
+    session: AsyncSession,
+    balance_service: BalanceCalculationService,
+    sample_user: User,
+    sample_account: Account,
 ):
     """Test user balance is positive (debt) when bills exceed payments.
 
@@ -123,15 +131,16 @@ async def test_user_balance_positive_when_bills_exceed_payments(
     session.add(bill)
     await session.commit()
 
-    service = BalanceCalculationService(session)
-    balance = await service.calculate_user_balance(sample_user.id)
+    balance = await balance_service.calculate_user_balance(sample_user.id)
     # Balance = 0 (incoming) - 100 (outgoing) + 150 (bills) = +50 (debt)
     assert balance == 50.0
 
 
-@pytest.mark.asyncio
 async def test_user_balance_formula_bills_minus_payments(
-    session: AsyncSession, sample_user: User, sample_account: Account
+    session: AsyncSession,
+    balance_service: BalanceCalculationService,
+    sample_user: User,
+    sample_account: Account,
 ):
     """Test user balance formula: Incoming - Outgoing + Bills."""
     # Create a destination account
@@ -174,15 +183,16 @@ async def test_user_balance_formula_bills_minus_payments(
     session.add_all([bill1, bill2])
     await session.commit()
 
-    service = BalanceCalculationService(session)
-    balance = await service.calculate_user_balance(sample_user.id)
+    balance = await balance_service.calculate_user_balance(sample_user.id)
     # Balance = 0 (incoming) - 300 (outgoing) + 120 (bills) = -180 (credit)
     assert balance == -180.0
 
 
-@pytest.mark.asyncio
 async def test_user_balance_equals_negative_payments_when_no_bills(
-    session: AsyncSession, sample_user: User, sample_account: Account
+    session: AsyncSession,
+    balance_service: BalanceCalculationService,
+    sample_user: User,
+    sample_account: Account,
 ):
     """Test user balance equals negative payments when no bills exist."""
     # Create a destination account
@@ -204,15 +214,14 @@ async def test_user_balance_equals_negative_payments_when_no_bills(
     await session.commit()
 
     # No bills - balance should equal negative payments
-    service = BalanceCalculationService(session)
-    balance = await service.calculate_user_balance(sample_user.id)
+    balance = await balance_service.calculate_user_balance(sample_user.id)
     # Balance = 0 (incoming) - 100 (outgoing) + 0 (bills) = -100 (credit)
     assert balance == -100.0
 
 
-@pytest.mark.asyncio
 async def test_multiple_user_balances(
     session: AsyncSession,
+    balance_service: BalanceCalculationService,
     sample_user: User,
     sample_account: Account,
     another_user: User,
@@ -247,19 +256,22 @@ async def test_multiple_user_balances(
 
     # User 2: 0 transactions, 0 bills = 0 balance
 
-    service = BalanceCalculationService(session)
-    balances = await service.calculate_multiple_user_balances([sample_user.id, another_user.id])
+    balances = await balance_service.calculate_multiple_user_balances(
+        [sample_user.id, another_user.id]
+    )
 
     # Balance = 0 (incoming) - 100 (outgoing) + 30 (bills) = -70 (credit)
     assert balances[sample_user.id] == -70.0
     assert balances[another_user.id] == 0.0
 
 
-@pytest.mark.asyncio
 async def test_user_balance_credit_and_debt_states(
-    session: AsyncSession, sample_user: User, sample_account: Account
+    session: AsyncSession,
+    balance_service: BalanceCalculationService,
+    sample_user: User,
+    sample_account: Account,
 ):
-    """Test balance correctly represents credit (negative) and debt (positive).
+    """Test balance moves from credit (negative) to debt (positive) as bills grow.
 
     With unified formula: Balance = Incoming - Outgoing + Bills
     - Negative = user has credit (overpaid: payments > bills)
@@ -273,8 +285,6 @@ async def test_user_balance_credit_and_debt_states(
     session.add(community_fund)
     await session.commit()
 
-    service = BalanceCalculationService(session)
-
     # Create outgoing transaction (payment)
     trans = Transaction(
         from_account_id=sample_account.id,
@@ -285,10 +295,10 @@ async def test_user_balance_credit_and_debt_states(
     session.add(trans)
     await session.commit()
 
-    # Scenario 1: Balance negative (credit) - paid 100, no bills
+    # Scenario 1: credit - paid 100, no bills
     # Balance = 0 - 100 + 0 = -100
-    balance = await service.calculate_user_balance(sample_user.id)
-    assert balance < 0, "Credit balance should be negative (overpaid)"
+    balance = await balance_service.calculate_user_balance(sample_user.id)
+    assert balance == -100.0
 
     # Add bills that exceed payments
     bill = Bill(
@@ -300,7 +310,23 @@ async def test_user_balance_credit_and_debt_states(
     session.add(bill)
     await session.commit()
 
-    # Scenario 2: Balance positive (debt) - paid 100, bills 200
+    # Scenario 2: debt - paid 100, bills 200
     # Balance = 0 - 100 + 200 = 100
-    balance = await service.calculate_user_balance(sample_user.id)
-    assert balance > 0, "Debt balance should be positive (owes money)"
+    balance = await balance_service.calculate_user_balance(sample_user.id)
+    assert balance == 100.0
+
+
+async def test_multiple_user_balances_keep_credit_and_debt_signs(monkeypatch):
+    """Test per-user balances are passed through with their sign intact.
+
+    Pure unit test: calculate_user_balance is mocked, so no database is needed.
+    """
+    mock_calculate = AsyncMock(side_effect=[-100.0, 100.0])
+    monkeypatch.setattr(BalanceCalculationService, "calculate_user_balance", mock_calculate)
+
+    service = BalanceCalculationService(MagicMock())
+    balances = await service.calculate_multiple_user_balances([1, 2])
+
+    assert balances[1] < 0, "Credit balance should be negative (overpaid)"
+    assert balances[2] > 0, "Debt balance should be positive (owes money)"
+    assert [c.args for c in mock_calculate.await_args_list] == [(1,), (2,)]
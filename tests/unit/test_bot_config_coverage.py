@@ -38,8 +38,9 @@ class TestBotConfigValidation:
             config = BotConfig(
                 telegram_bot_name="test", telegram_mini_app_id="app", telegram_bot_token=""
             )
-            with pytest.raises(ValueError, match="TELEGRAM_BOT_TOKEN"):
+            with pytest.raises(ValueError) as excinfo:
                 config.validate()
+            assert "TELEGRAM_BOT_TOKEN" in str(excinfo.value)
 
     def test_bot_config_fields(self):
         """Test bot config has required fields."""
@@ -10,7 +10,12 @@ from src.bot import create_bot_app
 class TestCreateBotApp:
     """Test cases for bot application creation."""
 
-    @pytest.mark.asyncio
+    @pytest.fixture(autouse=True)
+    def bot_env(self, monkeypatch):
+        """Provide the settings BotConfig requires, independent of test order."""
+        monkeypatch.setenv("TELEGRAM_BOT_NAME", "test_bot")
+        monkeypatch.setenv("TELEGRAM_MINI_APP_ID", "test_app")
+
     async def test_create_bot_app_success(self):
         """Test successful bot application creation."""
         with patch("src.bot.Application") as mock_app_class:
@@ -32,7 +37,6 @@ class TestCreateBotApp:
                             assert result is mock_app_instance
                             mock_app_instance.add_handler.assert_called()
 
-    @pytest.mark.asyncio
     async def test_create_bot_app_registers_command_handlers(self):
         """Test bot app registers command handlers correctly."""
         with patch("src.bot.Application") as mock_app_class:
@@ -57,7 +61,6 @@ class TestCreateBotApp:
                                         # Verify add_handler was called multiple times
                                         assert mock_app_instance.add_handler.call_count >= 3
 
-    @pytest.mark.asyncio
     async def test_create_bot_app_registers_message_handler(self):
         """Test bot app registers message handler for admin responses."""
         with patch("src.bot.Application") as mock_app_class:
@@ -82,7 +85,6 @@ class TestCreateBotApp:
                                         # Verify MessageHandler was instantiated at least once
                                         assert mock_msg_handler_class.call_count >= 1
 
-    @pytest.mark.asyncio
     async def test_create_bot_app_registers_callback_handler(self):
         """Test bot app registers callback query handler for approve/reject buttons."""
         with patch("src.bot.Application") as mock_app_class:
@@ -107,7 +109,6 @@ class TestCreateBotApp:
                                     # Note: Should be called at least once for admin callback
                                     assert mock_callback_class.call_count >= 1
 
-    @pytest.mark.asyncio
     async def test_create_bot_app_returns_application_instance(self):
         """Test create_bot_app returns an Application instance."""
         with patch("src.bot.Application") as mock_app_class:
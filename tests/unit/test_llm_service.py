@@ -8,242 +8,255 @@ import pytest
 from src.services.llm_service import (
     OllamaService,
     ToolContext,
+    _execute_tool_dict,
     execute_tool,
     get_admin_tools,
     get_user_tools,
 )
 
 
+def async_return(value):
+    """Build a coroutine function returning value (lighter than AsyncMock).
+
+    Use only where the test does not assert on calls; keep AsyncMock otherwise.
+    """
+
+    async def _return(*args, **kwargs):
+        return value
+
+    return _return
+
+
+@pytest.fixture(scope="module")
+def user_tools():
+    """Tool definitions exposed to regular users, built once per module."""
+    return get_user_tools()
+
+
+@pytest.fixture(scope="module")
+def admin_tools():
+    """Tool definitions exposed to administrators, built once per module."""
+    return get_admin_tools()
+
+
+@pytest.fixture
+def mock_session():
+    """Async session stand-in for tool execution."""
+    return AsyncMock()
+
+
+@pytest.fixture
+def user_ctx(mock_session):
+    """Tool context for a regular user."""
+    return ToolContext(user_id=1, is_admin=False, session=mock_session)
+
+
+@pytest.fixture
+def admin_ctx(mock_session):
+    """Tool context for an administrator."""
+    return ToolContext(user_id=1, is_admin=True, session=mock_session)
+
+
+@pytest.fixture
+def patched_balance_service():
+    """Patch BalanceCalculationService in llm_service; yields the mock class."""
+    with patch("src.services.llm_service.BalanceCalculationService") as mock_service_cls:
+        yield mock_service_cls
+
+
+@pytest.fixture
+def patched_period_service():
+    """Patch AsyncServicePeriodService in llm_service; yields the mock class."""
+    with patch("src.services.llm_service.AsyncServicePeriodService") as mock_service_cls:
+        yield mock_service_cls
+
+
 class TestToolDefinitions:
     """Tests for tool definition functions."""
 
-    def test_get_user_tools_returns_read_only_tools(self):
-        """Verify user tools are read-only operations."""
-        tools = get_user_tools()
-        assert len(tools) == 3
-
-        tool_names = [t["function"]["name"] for t in tools]
-        assert "get_balance" in tool_names
-        assert "list_bills" in tool_names
-        assert "get_period_info" in tool_names
-        assert "create_service_period" not in tool_names
-
-    def test_get_admin_tools_includes_write_operations(self):
-        """Verify admin tools include write operations."""
-        tools = get_admin_tools()
-        assert len(tools) == 5
-
-        tool_names = [t["function"]["name"] for t in tools]
-        assert "get_balance" in tool_names
-        assert "list_bills" in tool_names
-        assert "get_period_info" in tool_names
-        assert "create_service_period" in tool_names
-        assert "create_transaction" in tool_names
-
-    def test_tool_schemas_are_valid(self):
+    @pytest.mark.parametrize(
+        "tools_fixture, expected_names, forbidden_names",
+        [
+            (
+                "user_tools",
+                {"get_balance", "list_bills", "get_period_info"},
+                {"create_service_period", "create_transaction"},
+            ),
+            (
+                "admin_tools",
+                {
+                    "get_balance",
+                    "list_bills",
+                    "get_period_info",
+                    "create_service_period",
+                    "create_transaction",
+                },
+                set(),
+            ),
+        ],
+        ids=["user_read_only", "admin_with_write_operations"],
+    )
+    def test_tools_for_role(self, request, tools_fixture, expected_names, forbidden_names):
+        """Verify each role gets exactly its tool set (users are read-only)."""
+        tools = request.getfixturevalue(tools_fixture)
+        tool_names = {t["function"]["name"] for t in tools}
+        assert tool_names == expected_names
+        assert not tool_names & forbidden_names
+
+    @pytest.mark.parametrize("tools_fixture", ["user_tools", "admin_tools"])
+    def test_tool_schemas_are_valid(self, request, tools_fixture):
         """Verify all tool schemas have required structure."""
-        for tools_fn in [get_user_tools, get_admin_tools]:
-            for tool in tools_fn():
-                assert tool["type"] == "function"
-                assert "function" in tool
-                assert "name" in tool["function"]
-                assert "description" in tool["function"]
-                assert "parameters" in tool["function"]
-                assert tool["function"]["parameters"]["type"] == "object"
+        for tool in request.getfixturevalue(tools_fixture):
+            assert tool["type"] == "function"
+            assert "function" in tool
+            assert "name" in tool["function"]
+            assert "description" in tool["function"]
+            assert "parameters" in tool["function"]
+            assert tool["function"]["parameters"]["type"] == "object"
 
 
 class TestToolExecution:
     """Tests for tool execution."""
 
-    @pytest.mark.asyncio
-    async def test_execute_unknown_tool_returns_error(self):
-        """Test that unknown tools return error."""
-        ctx = ToolContext(user_id=1, is_admin=False, session=MagicMock())
-        result = await execute_tool("unknown_tool", {}, ctx)
+    @pytest.mark.parametrize(
+        "tool_name, arguments, expected_error",
+        [
+            ("unknown_tool", {}, "Unknown tool"),
+            ("get_period_info", {}, "period_id is required"),
+            (
+                "create_service_period",
+                {"name": "Test", "start_date": "2025-01-01", "end_date": "2025-03-31"},
+                "Admin access required",
+            ),
+        ],
+        ids=["unknown_tool", "missing_period_id", "non_admin_create_period"],
+    )
+    async def test_execute_tool_error_paths(self, user_ctx, tool_name, arguments, expected_error):
+        """Test tool calls rejected before touching any service return an error."""
+        result = await execute_tool(tool_name, arguments, user_ctx)
         data = json.loads(result)
         assert "error" in data
-        assert "Unknown tool" in data["error"]
+        assert expected_error in data["error"]
 
-    @pytest.mark.asyncio
-    async def test_execute_get_balance_user_not_found(self):
+    async def test_execute_get_balance_user_not_found(self, user_ctx, patched_balance_service):
         """Test get_balance when user not found."""
-        mock_session = AsyncMock()
-        ctx = ToolContext(user_id=999, is_admin=False, session=mock_session)
-
-        with patch("src.services.llm_service.BalanceCalculationService") as mock_service_cls:
-            mock_service = MagicMock()
-            mock_service.get_user_by_id = AsyncMock(return_value=None)
-            mock_service_cls.return_value = mock_service
+        mock_service = patched_balance_service.return_value
+        mock_service.get_user_by_id = async_return(None)
 
-            result = await execute_tool("get_balance", {}, ctx)
-            data = json.loads(result)
-            assert "error" in data
-            assert "not found" in data["error"]
+        data = await _execute_tool_dict("get_balance", {}, user_ctx)
+        assert "error" in data
+        assert "not found" in data["error"]
 
-    @pytest.mark.asyncio
-    async def test_execute_get_balance_success(self):
+    async def test_execute_get_balance_success(self, user_ctx, patched_balance_service):
         """Test get_balance returns balance data."""
-        mock_session = AsyncMock()
-        ctx = ToolContext(user_id=1, is_admin=False, session=mock_session)
-
-        with patch("src.services.llm_service.BalanceCalculationService") as mock_service_cls:
-            mock_user = MagicMock()
-            mock_user.name = "Test User"
-            mock_account = MagicMock()
-            mock_account.updated_at = None
-
-            mock_service = MagicMock()
-            mock_service.get_user_by_id = AsyncMock(return_value=mock_user)
-            mock_service.get_account_for_user = AsyncMock(return_value=mock_account)
-            mock_service.calculate_user_balance = AsyncMock(return_value=100.50)
-            mock_service_cls.return_value = mock_service
-
-            result = await execute_tool("get_balance", {}, ctx)
-            data = json.loads(result)
-
-            assert data["user_id"] == 1
-            assert data["user_name"] == "Test User"
-            assert data["balance"] == 100.50
-            # Currency comes from locale_service.CURRENCY (set via LOCALE env)
-            assert data["currency"] == "RUB"
-
-    @pytest.mark.asyncio
-    async def test_execute_list_bills_success(self):
+        mock_user = MagicMock()
+        mock_user.name = "Test User"
+        mock_account = MagicMock()
+        mock_account.updated_at = None
+
+        mock_service = patched_balance_service.return_value
+        mock_service.get_user_by_id = async_return(mock_user)
+        mock_service.get_account_for_user = async_return(mock_account)
+        mock_service.calculate_user_balance = async_return(100.50)
+
+        data = await _execute_tool_dict("get_balance", {}, user_ctx)
+
+        assert data["user_id"] == 1
+        assert data["user_name"] == "Test User"
+        assert data["balance"] == 100.50
+        # Currency comes from locale_service.CURRENCY (set via LOCALE env)
+        assert data["currency"] == "RUB"
+
+    async def test_execute_list_bills_success(self, user_ctx, patched_balance_service):
         """Test list_bills returns bills data."""
-        mock_session = AsyncMock()
-        ctx = ToolContext(user_id=1, is_admin=False, session=mock_session)
-
-        with patch("src.services.llm_service.BalanceCalculationService") as mock_service_cls:
-            mock_account = MagicMock()
-            mock_bill = MagicMock()
-            mock_bill.bill_id = "B001"
-            mock_bill.amount = 50.00
-            mock_bill.bill_date = "2025-01-15"
-            mock_bill.bill_type = "electricity"
-
-            mock_service = MagicMock()
-            mock_service.get_account_for_user = AsyncMock(return_value=mock_account)
-            mock_service.list_bills_for_user = AsyncMock(return_value=[mock_bill])
-            mock_service_cls.return_value = mock_service
-
-            result = await execute_tool("list_bills", {"limit": 5}, ctx)
-            data = json.loads(result)
-
-            assert data["user_id"] == 1
-            assert len(data["bills"]) == 1
-            assert data["bills"][0]["bill_id"] == "B001"
-
-    @pytest.mark.asyncio
-    async def test_execute_get_period_info_not_found(self):
-        """Test get_period_info when period not found."""
-        mock_session = AsyncMock()
-        ctx = ToolContext(user_id=1, is_admin=False, session=mock_session)
+        mock_account = MagicMock()
+        mock_bill = MagicMock()
+        mock_bill.bill_id = "B001"
+        mock_bill.amount = 50.00
+        mock_bill.bill_date = "2025-01-15"
+        mock_bill.bill_type = "electricity"
 
-        with patch("src.services.llm_service.AsyncServicePeriodService") as mock_service_cls:
-            mock_service = MagicMock()
-            mock_service.get_period_info = AsyncMock(return_value=None)
-            mock_service_cls.return_value = mock_service
+        mock_service = patched_balance_service.return_value
+        mock_service.get_account_for_user = async_return(mock_account)
+        mock_service.list_bills_for_user = async_return([mock_bill])
 
-            result = await execute_tool("get_period_info", {"period_id": 999}, ctx)
-            data = json.loads(result)
-            assert "error" in data
-            assert "not found" in data["error"]
+        data = await _execute_tool_dict("list_bills", {"limit": 5}, user_ctx)
 
-    @pytest.mark.asyncio
-    async def test_execute_get_period_info_success(self):
-        """Test get_period_info returns period data."""
-        mock_session = AsyncMock()
-        ctx = ToolContext(user_id=1, is_admin=False, session=mock_session)
-
-        with patch("src.services.llm_service.AsyncServicePeriodService") as mock_service_cls:
-            mock_period = MagicMock()
-            mock_period.period_id = 1
-            mock_period.name = "Q1 2025"
-            mock_period.start_date = "2025-01-01"
-            mock_period.end_date = "2025-03-31"
-            mock_period.is_active = True
-
-            mock_service = MagicMock()
-            mock_service.get_period_info = AsyncMock(return_value=mock_period)
-            mock_service_cls.return_value = mock_service
-
-            result = await execute_tool("get_period_info", {"period_id": 1}, ctx)
-            data = json.loads(result)
-
-            assert data["period_id"] == 1
-            assert data["name"] == "Q1 2025"
-            assert data["active"] is True
-
-    @pytest.mark.asyncio
-    async def test_execute_get_period_info_missing_id(self):
-        """Test get_period_info without period_id returns error."""
-        mock_session = AsyncMock()
-        ctx = ToolContext(user_id=1, is_admin=False, session=mock_session)
-
-        result = await execute_tool("get_period_info", {}, ctx)
-        data = json.loads(result)
-        assert "error" in data
-        assert "period_id is required" in data["error"]
+        assert data["user_id"] == 1
+        assert len(data["bills"]) == 1
+        assert data["bills"][0]["bill_id"] == "B001"
 
-    @pytest.mark.asyncio
-    async def test_execute_create_period_non_admin_blocked(self):
-        """Test create_service_period blocked for non-admin."""
-        mock_session = AsyncMock()
-        ctx = ToolContext(user_id=1, is_admin=False, session=mock_session)
+    async def test_execute_get_period_info_not_found(self, user_ctx, patched_period_service):
+        """Test get_period_info when period not found."""
+        mock_service = patched_period_service.return_value
+        mock_service.get_period_info = async_return(None)
 
-        result = await execute_tool(
-            "create_service_period",
-            {"name": "Test", "start_date": "2025-01-01", "end_date": "2025-03-31"},
-            ctx,
-        )
+        data = await _execute_tool_dict("get_period_info", {"period_id": 999}, user_ctx)
+        assert "error" in data
+        assert "not found" in data["error"]
+
+    async def test_execute_get_period_info_success(self, user_ctx, patched_period_service):
+        """Test get_period_info returns period data."""
+        mock_period = MagicMock()
+        mock_period.period_id = 1
+        mock_period.name = "Q1 2025"
+        mock_period.start_date = "2025-01-01"
+        mock_period.end_date = "2025-03-31"
+        mock_period.is_active = True
+
+        mock_service = patched_period_service.return_value
+        mock_service.get_period_info = async_return(mock_period)
+
+        data = await _execute_tool_dict("get_period_info", {"period_id": 1}, user_ctx)
+
+        assert data["period_id"] == 1
+        assert data["name"] == "Q1 2025"
+        assert data["active"] is True
+
+    async def test_execute_tool_unserializable_result_returns_error(
+        self, user_ctx, patched_period_service
+    ):
+        """Test execute_tool reports a JSON error when the result cannot be encoded."""
+        mock_period = MagicMock()  # MagicMock attributes are not JSON serializable
+        mock_service = patched_period_service.return_value
+        mock_service.get_period_info = async_return(mock_period)
+
+        result = await execute_tool("get_period_info", {"period_id": 1}, user_ctx)
         data = json.loads(result)
         assert "error" in data
-        assert "Admin access required" in data["error"]
 
-    @pytest.mark.asyncio
-    async def test_execute_create_period_invalid_date(self):
+    async def test_execute_create_period_invalid_date(self, admin_ctx):
         """Test create_service_period with invalid date format."""
-        mock_session = AsyncMock()
-        ctx = ToolContext(user_id=1, is_admin=True, session=mock_session)
-
-        result = await execute_tool(
+        data = await _execute_tool_dict(
             "create_service_period",
             {"name": "Test", "start_date": "invalid", "end_date": "2025-03-31"},
-            ctx,
+            admin_ctx,
         )
-        data = json.loads(result)
         assert "error" in data
         assert "Invalid date format" in data["error"]
 
-    @pytest.mark.asyncio
-    async def test_execute_create_period_success(self):
+    async def test_execute_create_period_success(self, admin_ctx, patched_period_service):
         """Test create_service_period succeeds for admin."""
-        mock_session = AsyncMock()
-        ctx = ToolContext(user_id=1, is_admin=True, session=mock_session)
-
-        with patch("src.services.llm_service.AsyncServicePeriodService") as mock_service_cls:
-            from datetime import date
+        from datetime import date
 
-            mock_period = MagicMock()
-            mock_period.id = 5
-            mock_period.name = "Q1 2025"
-            mock_period.start_date = date(2025, 1, 1)
-            mock_period.end_date = date(2025, 3, 31)
+        mock_period = MagicMock()
+        mock_period.id = 5
+        mock_period.name = "Q1 2025"
+        mock_period.start_date = date(2025, 1, 1)
+        mock_period.end_date = date(2025, 3, 31)
 
-            mock_service = MagicMock()
-            mock_service.create_period = AsyncMock(return_value=mock_period)
-            mock_service_cls.return_value = mock_service
+        mock_service = patched_period_service.return_value
+        mock_service.create_period = async_return(mock_period)
 
-            result = await execute_tool(
-                "create_service_period",
-                {"name": "Q1 2025", "start_date": "2025-01-01", "end_date": "2025-03-31"},
-                ctx,
-            )
-            data = json.loads(result)
+        data = await _execute_tool_dict(
+            "create_service_period",
+            {"name": "Q1 2025", "start_date": "2025-01-01", "end_date": "2025-03-31"},
+            admin_ctx,
+        )
 
-            assert data["success"] is True
-            assert data["period_id"] == 5
-            assert data["name"] == "Q1 2025"
+        assert data["success"] is True
+        assert data["period_id"] == 5
+        assert data["name"] == "Q1 2025"
 
 
 class TestOllamaService:
@@ -273,25 +286,20 @@ class TestOllamaService:
         assert service.is_admin is True
         assert service.model == "custom-model"
 
-    def test_get_tools_for_user(self):
+    def test_get_tools_for_user(self, user_tools):
         """Test user gets read-only tools."""
         mock_session = MagicMock()
         service = OllamaService(session=mock_session, user_id=1, is_admin=False)
 
-        tools = service._get_tools()
-        tool_names = [t["function"]["name"] for t in tools]
-        assert "create_service_period" not in tool_names
+        assert service._get_tools() == user_tools
 
-    def test_get_tools_for_admin(self):
+    def test_get_tools_for_admin(self, admin_tools):
         """Test admin gets all tools including write operations."""
         mock_session = MagicMock()
         service = OllamaService(session=mock_session, user_id=1, is_admin=True)
 
-        tools = service._get_tools()
-        tool_names = [t["function"]["name"] for t in tools]
-        assert "create_service_period" in tool_names
+        assert service._get_tools() == admin_tools
 
-    @pytest.mark.asyncio
     async def test_chat_returns_response(self):
         """Test chat returns LLM response."""
         mock_session = MagicMock()
@@ -312,7 +320,6 @@ class TestOllamaService:
             assert result == "Your balance is $100.50"
             mock_chat.assert_called_once()
 
-    @pytest.mark.asyncio
     async def test_chat_handles_tool_call(self):
         """Test chat handles tool calls and returns final response."""
         mock_session = MagicMock()
@@ -353,7 +360,6 @@ class TestOllamaService:
                 assert mock_chat.call_count == 2
                 mock_execute.assert_called_once_with("get_balance", {}, service.tool_context)
 
-    @pytest.mark.asyncio
     async def test_chat_handles_connection_error(self):
         """Test chat handles Ollama connection errors gracefully."""
         mock_session = MagicMock()
@@ -367,7 +373,6 @@ class TestOllamaService:
             assert "error" in result.lower()
             assert "Connection refused" in result
 
-    @pytest.mark.asyncio
     async def test_chat_max_tool_calls_limit(self):
         """Test chat respects max tool calls limit."""
         mock_session = MagicMock()
@@ -5,9 +5,48 @@ import tempfile
 from pathlib import Path
 from unittest.mock import patch
 
+import pytest
+
 from src.services.logging import setup_server_logging
 
 
+@pytest.fixture(scope="module")
+def configured_logging():
+    """Configure server logging once for all output-format tests in this module.
+
+    Yields (root_logger, log_file). Handlers are closed and the original root
+    logger state restored at module teardown.
+    """
+    root_logger = logging.getLogger()
+    original_handlers = root_logger.handlers.copy()
+    original_level = root_logger.level
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        log_file = Path(temp_dir) / "server.log"
+        with patch.dict("os.environ", {"LOG_LEVEL": "INFO"}, clear=False):
+            setup_server_logging(str(log_file))
+
+        yield root_logger, log_file
+
+        for handler in root_logger.handlers[:]:
+            handler.close()
+            root_logger.removeHandler(handler)
+
+    for handler in original_handlers:
+        root_logger.addHandler(handler)
+    root_logger.setLevel(original_level)
+
+
+@pytest.fixture
+def log_file(configured_logging) -> Path:
+    """Return the shared log file, truncated so each test sees only its own output."""
+    root_logger, log_file = configured_logging
+    for handler in root_logger.handlers:
+        handler.flush()
+    log_file.write_text("")
+    return log_file
+
+
 class TestServerLogging:
     """Test server logging configuration."""
 
@@ -77,70 +116,6 @@ class TestServerLogging:
                 for handler in self.root_logger.handlers:
                     assert handler.level == logging.INFO
 
-    def test_setup_server_logging_writes_to_file(self) -> None:
-        """Verify setup_server_logging writes log messages to file."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            log_file = Path(temp_dir) / "server.log"
-
-            setup_server_logging(str(log_file))
-
-            # Log a test message
-            test_logger = logging.getLogger("test.module")
-            test_message = "Test log message"
-            test_logger.info(test_message)
-
-            # Verify file exists and contains message
-            assert log_file.exists()
-            log_contents = log_file.read_text()
-            assert test_message in log_contents
-
-    def test_setup_server_logging_formatter_has_timestamp(self) -> None:
-        """Verify log formatter includes ISO timestamps."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            log_file = Path(temp_dir) / "server.log"
-
-            setup_server_logging(str(log_file))
-
-            # Log a test message
-            test_logger = logging.getLogger("test.timestamp")
-            test_logger.info("Timestamp test")
-
-            # Verify ISO format timestamp in log
-            log_contents = log_file.read_text()
-            # ISO format: [YYYY-MM-DD HH:MM:SS]
-            assert "[202" in log_contents  # Year starts with 202x
-
-    def test_setup_server_logging_formatter_includes_logger_name(self) -> None:
-        """Verify log formatter includes logger name."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            log_file = Path(temp_dir) / "server.log"
-
-            setup_server_logging(str(log_file))
-
-            # Log with specific logger name
-            test_logger = logging.getLogger("custom.logger")
-            test_logger.info("Test message")
-
-            # Verify logger name in output
-            log_contents = log_file.read_text()
-            assert "custom.logger" in log_contents
-
-    def test_setup_server_logging_formatter_includes_level(self) -> None:
-        """Verify log formatter includes log level."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            log_file = Path(temp_dir) / "server.log"
-
-            setup_server_logging(str(log_file))
-
-            # Log at different levels
-            test_logger = logging.getLogger("test.level")
-            test_logger.info("Info message")
-            test_logger.warning("Warning message")
-
-            log_contents = log_file.read_text()
-            assert "INFO" in log_contents
-            assert "WARNING" in log_contents
-
     def test_setup_server_logging_removes_existing_handlers(self) -> None:
         """Verify setup_server_logging clears existing handlers to avoid duplicates."""
         with tempfile.TemporaryDirectory() as temp_dir:
@@ -159,3 +134,51 @@ class TestServerLogging:
             # Should have exactly 2 handlers (not 3+)
             assert len(self.root_logger.handlers) == 2
             assert dummy_handler not in self.root_logger.handlers
+
+
+class TestServerLoggingOutput:
+    """Test log output format against a single shared logging configuration."""
+
+    def test_setup_server_logging_writes_to_file(self, log_file: Path) -> None:
+        """Verify setup_server_logging writes log messages to file."""
+        # Log a test message
+        test_logger = logging.getLogger("test.module")
+        test_message = "Test log message"
+        test_logger.info(test_message)
+
+        # Verify file exists and contains message
+        assert log_file.exists()
+        log_contents = log_file.read_text()
+        assert test_message in log_contents
+
+    def test_setup_server_logging_formatter_has_timestamp(self, log_file: Path) -> None:
+        """Verify log formatter includes ISO timestamps."""
+        # Log a test message
+        test_logger = logging.getLogger("test.timestamp")
+        test_logger.info("Timestamp test")
+
+        # Verify ISO format timestamp in log
+        log_contents = log_file.read_text()
+        # ISO format: [YYYY-MM-DD HH:MM:SS]
+        assert "[202" in log_contents  # Year starts with 202x
+
+    def test_setup_server_logging_formatter_includes_logger_name(self, log_file: Path) -> None:
+        """Verify log formatter includes logger name."""
+        # Log with specific logger name
+        test_logger = logging.getLogger("custom.logger")
+        test_logger.info("Test message")
+
+        # Verify logger name in output
+        log_contents = log_file.read_text()
+        assert "custom.logger" in log_contents
+
+    def test_setup_server_logging_formatter_includes_level(self, log_file: Path) -> None:
+        """Verify log formatter includes log level."""
+        # Log at different levels
+        test_logger = logging.getLogger("test.level")
+        test_logger.info("Info message")
+        test_logger.warning("Warning message")
+
+        log_contents = log_file.read_text()
+        assert "INFO" in log_contents
+        assert "WARNING" in log_contents
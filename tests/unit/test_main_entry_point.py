@@ -1,274 +1,205 @@
 """Unit tests for src/main.py entry point."""
 
-import asyncio
 import os
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
+from src.main import (
+    _load_environment,
+    _on_shutdown,
+    _validate_environment,
+    initialize_bot,
+    main,
+    run_webhook_mode,
+)
+
 
 def _close_coroutine(coro):
     """Helper to properly close a coroutine and avoid RuntimeWarning."""
-    if asyncio.iscoroutine(coro):
-        coro.close()
-    return None
-
-
-@pytest.mark.asyncio
-async def test_load_environment_with_env_file():
+    coro.close()
+
+
+@pytest.fixture(scope="session")
+def _bot_app_template():
+    """Build the bot Application mock once per session."""
+    template = AsyncMock()
+    template.bot = AsyncMock()
+    template.bot.set_webhook = AsyncMock(return_value=None)
+    template.bot.delete_webhook = AsyncMock(return_value=None)
+    template.initialize = AsyncMock(return_value=None)
+    template.shutdown = AsyncMock()
+    return template
+
+
+@pytest.fixture
+def bot_app(_bot_app_template):
+    """Return the shared bot Application mock with calls and side effects cleared.
+
+    copy.copy() would share child mocks between tests, so per-test side effects
+    would leak; reset_mock() clears them recursively instead.
+    """
+    _bot_app_template.reset_mock(side_effect=True)
+    return _bot_app_template
+
+
+@pytest.fixture
+def webhook_mocks(monkeypatch, bot_app):
+    """Patch run_webhook_mode's collaborators so it runs without Telegram or a server.
+
+    Tests override only the attribute they vary, e.g.
+    ``webhook_mocks.bot_app.shutdown.side_effect = Exception(...)``.
+    """
+    server = MagicMock()
+    server.serve = AsyncMock(return_value=None)
+    mocks = SimpleNamespace(
+        bot_app=bot_app,
+        create_bot_app=AsyncMock(return_value=bot_app),
+        setup_webhook_route=AsyncMock(),
+        server=server,
+        app=MagicMock(),
+    )
+    monkeypatch.setattr("src.main.create_bot_app", mocks.create_bot_app)
+    monkeypatch.setattr("src.main.setup_webhook_route", mocks.setup_webhook_route)
+    monkeypatch.setattr("src.main.uvicorn.Server", MagicMock(return_value=server))
+    # Keep shutdown handlers off the real FastAPI app and restore the global bot
+    monkeypatch.setattr("src.main.app", mocks.app)
+    monkeypatch.setattr("src.main.bot_app", None)
+    monkeypatch.setenv("MINI_APP_URL", "https://example.com/app")
+    yield mocks
+
+
+def test_load_environment_with_env_file():
     """Test _load_environment loads from .env file."""
-    from src.main import _load_environment
-
     with patch("src.main.load_dotenv") as mock_load_dotenv:
         _load_environment()
         assert mock_load_dotenv.called
 
 
-@pytest.mark.asyncio
-async def test_load_environment_with_temp_env_file():
-    """Test _load_environment loads from /tmp/.sosenki-env if exists."""
-    from src.main import _load_environment
+def test_load_environment_with_temp_env_file(tmp_path, monkeypatch):
+    """Test _load_environment loads a dynamic env file over existing values."""
+    env_file = tmp_path / ".sosenki-env"
+    env_file.write_text("SOSENKI_TEST_VAR=dynamic\n")
+    monkeypatch.setenv("SOSENKI_TEST_VAR", "static")
 
-    with patch("src.main.Path") as mock_path:
-        mock_path.return_value.exists.return_value = True
-        with patch("src.main.load_dotenv") as mock_load_dotenv:
-            _load_environment()
-            assert mock_load_dotenv.called
-
-
-@pytest.mark.asyncio
-async def test_validate_environment_success():
-    """Test _validate_environment succeeds when MINI_APP_URL is set."""
-    from src.main import _validate_environment
+    _load_environment(candidates=[env_file])
 
-    with patch.dict(os.environ, {"MINI_APP_URL": "https://example.com/app"}):
-        _validate_environment()
+    assert os.environ["SOSENKI_TEST_VAR"] == "dynamic"
 
 
-@pytest.mark.asyncio
-async def test_validate_environment_missing_mini_app_url():
-    """Test _validate_environment raises when MINI_APP_URL is missing."""
-    from src.main import _validate_environment
+def test_load_environment_skips_missing_temp_env_file(tmp_path, monkeypatch):
+    """Test _load_environment ignores dynamic env files that do not exist."""
+    monkeypatch.setenv("SOSENKI_TEST_VAR", "static")
 
-    with patch.dict(os.environ, {}, clear=True):
-        with pytest.raises(RuntimeError, match="MINI_APP_URL"):
-            _validate_environment()
+    _load_environment(candidates=[tmp_path / "missing.env"])
 
+    assert os.environ["SOSENKI_TEST_VAR"] == "static"
 
-@pytest.mark.asyncio
-async def test_validate_environment_empty_mini_app_url():
-    """Test _validate_environment raises when MINI_APP_URL is empty."""
-    from src.main import _validate_environment
 
-    with patch.dict(os.environ, {"MINI_APP_URL": "   "}):
-        with pytest.raises(RuntimeError, match="MINI_APP_URL"):
-            _validate_environment()
+def test_validate_environment_success(monkeypatch):
+    """Test _validate_environment succeeds when MINI_APP_URL is set."""
+    monkeypatch.setenv("MINI_APP_URL", "https://example.com/app")
+    _validate_environment()
+
+
+@pytest.mark.parametrize("value", [None, "", "   "], ids=["missing", "empty", "whitespace"])
+def test_validate_environment_invalid_mini_app_url(monkeypatch, value):
+    """Test _validate_environment raises when MINI_APP_URL is missing or blank."""
+    if value is None:
+        monkeypatch.delenv("MINI_APP_URL", raising=False)
+    else:
+        monkeypatch.setenv("MINI_APP_URL", value)
+    with pytest.raises(RuntimeError, match="MINI_APP_URL"):
+        _validate_environment()
 
 
-@pytest.mark.asyncio
-async def test_initialize_bot():
+async def test_initialize_bot(bot_app):
     """Test initialize_bot creates bot application."""
-    from src.main import initialize_bot
-
-    mock_bot_app = AsyncMock()
     with patch("src.main.create_bot_app", new_callable=AsyncMock) as mock_create:
-        mock_create.return_value = mock_bot_app
+        mock_create.return_value = bot_app
         await initialize_bot()
         mock_create.assert_called_once()
 
 
-@pytest.mark.asyncio
-async def test_run_webhook_mode_initialization():
+async def test_run_webhook_mode_initialization(webhook_mocks, monkeypatch):
     """Test run_webhook_mode initializes bot and registers webhook."""
-    from src.main import run_webhook_mode
+    monkeypatch.setenv("WEBHOOK_URL", "https://example.com/webhook")
+    await run_webhook_mode(host="127.0.0.1", port=8001)
 
-    mock_bot_app = AsyncMock()
-    mock_bot_app.bot = AsyncMock()
-    mock_bot_app.initialize = AsyncMock()
-    mock_bot_app.shutdown = AsyncMock()
+    webhook_mocks.setup_webhook_route.assert_called_once()
+    webhook_mocks.bot_app.initialize.assert_awaited_once()
+    webhook_mocks.bot_app.bot.set_webhook.assert_awaited_once_with(
+        url="https://example.com/webhook", drop_pending_updates=True
+    )
+    webhook_mocks.server.serve.assert_awaited_once()
 
-    with patch("src.main.create_bot_app", new_callable=AsyncMock) as mock_create:
-        mock_create.return_value = mock_bot_app
-        with patch("src.main.setup_webhook_route", new_callable=AsyncMock) as mock_setup:
-            mock_setup.return_value = None
-            with patch("src.main.uvicorn.Server") as mock_server:
-                mock_server_instance = MagicMock()
-                mock_server_instance.serve = AsyncMock()
-                mock_server.return_value = mock_server_instance
-
-                with patch.dict(
-                    os.environ,
-                    {
-                        "WEBHOOK_URL": "https://example.com/webhook",
-                        "MINI_APP_URL": "https://example.com/app",
-                    },
-                ):
-                    try:
-                        await run_webhook_mode(host="127.0.0.1", port=8001)
-                    except Exception:
-                        pass
-                    mock_setup.assert_called_once()
-
-
-@pytest.mark.asyncio
-async def test_run_webhook_mode_no_webhook_url():
+    # The registered shutdown handler must shut down the bot created above
+    event, handler = webhook_mocks.app.add_event_handler.call_args.args
+    assert event == "shutdown"
+    await handler()
+    webhook_mocks.bot_app.shutdown.assert_awaited_once()
+
+
+async def test_run_webhook_mode_no_webhook_url(webhook_mocks, monkeypatch):
     """Test run_webhook_mode handles missing WEBHOOK_URL gracefully."""
-    from src.main import run_webhook_mode
+    monkeypatch.delenv("WEBHOOK_URL", raising=False)
+    logger = MagicMock()
+    monkeypatch.setattr("src.main.logger", logger)
+    await run_webhook_mode()
 
-    mock_bot_app = AsyncMock()
-    mock_bot_app.bot = AsyncMock()
-    mock_bot_app.initialize = AsyncMock()
-    mock_bot_app.shutdown = AsyncMock()
+    webhook_mocks.bot_app.bot.set_webhook.assert_not_awaited()
+    logger.warning.assert_called_once_with("WEBHOOK_URL not set in environment")
+    webhook_mocks.server.serve.assert_awaited_once()
 
-    with patch("src.main.create_bot_app", new_callable=AsyncMock) as mock_create:
-        mock_create.return_value = mock_bot_app
-        with patch("src.main.setup_webhook_route", new_callable=AsyncMock):
-            with patch("src.main.uvicorn.Server") as mock_server:
-                mock_server_instance = MagicMock()
-                mock_server_instance.serve = AsyncMock()
-                mock_server.return_value = mock_server_instance
-
-                with patch.dict(
-                    os.environ,
-                    {"MINI_APP_URL": "https://example.com/app"},
-                    clear=True,
-                ):
-                    try:
-                        await run_webhook_mode()
-                    except Exception:
-                        pass
-
-
-@pytest.mark.asyncio
-async def test_main_webhook_mode_argument():
+
+def test_main_webhook_mode_argument(monkeypatch):
     """Test main() parses webhook mode argument correctly."""
-    from src.main import main
+    monkeypatch.setenv("PORT", "8000")
+    monkeypatch.setattr("sys.argv", ["prog", "--mode", "webhook", "--port", "9000"])
+    run = MagicMock(side_effect=_close_coroutine)
+    monkeypatch.setattr("src.main.asyncio.run", run)
 
-    with patch("src.main.asyncio.run", side_effect=_close_coroutine) as mock_run:
-        with patch("sys.argv", ["prog", "--mode", "webhook", "--port", "9000"]):
-            main()
-            mock_run.assert_called_once()
+    main()
 
+    assert run.call_count == 1
 
-@pytest.mark.asyncio
-async def test_main_default_arguments():
-    """Test main() uses correct defaults."""
-    from src.main import main
 
-    with patch("src.main.asyncio.run", side_effect=_close_coroutine) as mock_run:
-        with patch("sys.argv", ["prog"]):
-            main()
-            mock_run.assert_called_once()
+def test_main_default_arguments(monkeypatch):
+    """Test main() uses correct defaults."""
+    monkeypatch.setenv("PORT", "8000")
+    monkeypatch.setattr("sys.argv", ["prog"])
+    run = MagicMock(side_effect=_close_coroutine)
+    monkeypatch.setattr("src.main.asyncio.run", run)
 
+    main()
 
-@pytest.mark.asyncio
-async def test_run_webhook_mode_bot_shutdown_error():
-    """Test run_webhook_mode handles bot shutdown errors gracefully."""
-    from src.main import run_webhook_mode
+    assert run.call_count == 1
 
-    mock_bot_app = AsyncMock()
-    mock_bot_app.bot = AsyncMock()
-    mock_bot_app.initialize = AsyncMock()
-    mock_bot_app.shutdown = AsyncMock(side_effect=Exception("Shutdown error"))
 
-    with patch("src.main.create_bot_app", new_callable=AsyncMock) as mock_create:
-        mock_create.return_value = mock_bot_app
-        with patch("src.main.setup_webhook_route", new_callable=AsyncMock):
-            with patch("src.main.uvicorn.Server") as mock_server:
-                mock_server_instance = MagicMock()
-                mock_server_instance.serve = AsyncMock()
-                mock_server.return_value = mock_server_instance
-
-                with patch.dict(
-                    os.environ,
-                    {"MINI_APP_URL": "https://example.com/app"},
-                ):
-                    try:
-                        await run_webhook_mode()
-                    except Exception:
-                        pass
-
-
-@pytest.mark.asyncio
-async def test_run_webhook_mode_webhook_setup_error():
+async def test_run_webhook_mode_webhook_setup_error(webhook_mocks, monkeypatch):
     """Test run_webhook_mode handles webhook setup errors gracefully."""
-    from src.main import run_webhook_mode
+    webhook_mocks.bot_app.bot.set_webhook.side_effect = Exception("Webhook error")
+    monkeypatch.setenv("WEBHOOK_URL", "https://example.com/webhook")
 
-    mock_bot_app = AsyncMock()
-    mock_bot_app.bot = AsyncMock()
-    mock_bot_app.bot.set_webhook = AsyncMock(side_effect=Exception("Webhook error"))
-    mock_bot_app.initialize = AsyncMock()
-    mock_bot_app.shutdown = AsyncMock()
+    await run_webhook_mode()
 
-    with patch("src.main.create_bot_app", new_callable=AsyncMock) as mock_create:
-        mock_create.return_value = mock_bot_app
-        with patch("src.main.setup_webhook_route", new_callable=AsyncMock):
-            with patch("src.main.uvicorn.Server") as mock_server:
-                mock_server_instance = MagicMock()
-                mock_server_instance.serve = AsyncMock()
-                mock_server.return_value = mock_server_instance
-
-                with patch.dict(
-                    os.environ,
-                    {
-                        "WEBHOOK_URL": "https://example.com/webhook",
-                        "MINI_APP_URL": "https://example.com/app",
-                    },
-                ):
-                    try:
-                        await run_webhook_mode()
-                    except Exception:
-                        pass
-
-
-@pytest.mark.asyncio
-async def test_run_webhook_mode_no_bot_app_on_startup():
-    """Test run_webhook_mode startup when bot_app is None."""
-    from src.main import run_webhook_mode
-
-    # Test the startup event handler when bot_app is None
-    with patch("src.main.create_bot_app", new_callable=AsyncMock) as mock_create:
-        with patch("src.main.setup_webhook_route", new_callable=AsyncMock):
-            with patch("src.main.uvicorn.Server") as mock_server:
-                mock_server_instance = MagicMock()
-                mock_server_instance.serve = AsyncMock()
-                mock_server.return_value = mock_server_instance
-
-                with patch.dict(
-                    os.environ,
-                    {"MINI_APP_URL": "https://example.com/app"},
-                ):
-                    # Simulate None bot_app to test the if bot_app check
-                    mock_create.return_value = None
-                    try:
-                        await run_webhook_mode()
-                    except Exception:
-                        pass
-
-
-@pytest.mark.asyncio
-async def test_run_webhook_mode_no_bot_app_on_shutdown():
-    """Test run_webhook_mode shutdown when bot_app is None."""
-    from src.main import run_webhook_mode
-
-    mock_bot_app = AsyncMock()
-    mock_bot_app.bot = AsyncMock()
-    mock_bot_app.initialize = AsyncMock()
-    mock_bot_app.shutdown = AsyncMock()
+    webhook_mocks.server.serve.assert_awaited_once()
 
-    with patch("src.main.create_bot_app", new_callable=AsyncMock) as mock_create:
-        mock_create.return_value = mock_bot_app
-        with patch("src.main.setup_webhook_route", new_callable=AsyncMock):
-            with patch("src.main.uvicorn.Server") as mock_server:
-                mock_server_instance = MagicMock()
-                mock_server_instance.serve = AsyncMock()
-                mock_server.return_value = mock_server_instance
-
-                with patch.dict(
-                    os.environ,
-                    {"MINI_APP_URL": "https://example.com/app"},
-                ):
-                    try:
-                        await run_webhook_mode()
-                    except Exception:
-                        pass
+
+async def test_on_shutdown_shuts_down_bot(bot_app):
+    """Test _on_shutdown shuts down the bot Application."""
+    await _on_shutdown(bot_app)
+    bot_app.shutdown.assert_awaited_once()
+
+
+async def test_on_shutdown_bot_shutdown_error(bot_app):
+    """Test _on_shutdown logs bot shutdown errors instead of raising."""
+    bot_app.shutdown.side_effect = Exception("Shutdown error")
+    await _on_shutdown(bot_app)
+    bot_app.shutdown.assert_awaited_once()
+
+
+async def test_on_shutdown_without_bot_app():
+    """Test _on_shutdown is a no-op when no bot Application was created."""
+    await _on_shutdown(None)
@@ -2,18 +2,131 @@
 
 import json
 from datetime import date as date_type
-from unittest.mock import AsyncMock, MagicMock, patch
+from datetime import datetime
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
+import src.api.mcp_server as mcp_module
 from src.api.mcp_server import mcp, mcp_lifespan
+from src.services.balance_service import UserBillInfo
+from src.services.locale_service import format_local_datetime
+
+# Tool registry is fixed at import time, so resolve each tool function once
+_TOOL_FNS = {t.name: t.fn for t in mcp._tool_manager._tools.values()}
+
+# One representative call per tool, and the service method each call hits first
+_TOOL_ARGS = {
+    "get_balance": (1,),
+    "list_bills": (1,),
+    "get_period_info": (1,),
+    "create_service_period": ("Test Period", "2025-09-01", "2026-01-31"),
+}
+_FIRST_SERVICE_CALL = {
+    "get_balance": ("BalanceCalculationService", "get_user_by_id"),
+    "list_bills": ("BalanceCalculationService", "get_account_for_user"),
+    "get_period_info": ("AsyncServicePeriodService", "get_period_info"),
+    "create_service_period": ("AsyncServicePeriodService", "create_period"),
+}
+
+# Full responses expected from the success-path tests
+_ACCOUNT_UPDATED_AT = datetime(2025, 12, 7, 10, 0)
+EXPECTED_BALANCE = {
+    "user_id": 1,
+    "account_id": 1,
+    "balance": 1000.50,
+    # Currency comes from locale_service.CURRENCY (set via LOCALE env)
+    "currency": "RUB",
+    "last_updated": format_local_datetime(_ACCOUNT_UPDATED_AT),
+}
+EXPECTED_BILLS = {
+    "user_id": 1,
+    "account_id": 1,
+    "currency": "RUB",
+    "bills": [
+        {
+            "bill_id": 1,
+            "amount": 100.0,
+            "bill_date": "2025-12-01",
+            "bill_type": "electricity",
+            "status": "PENDING",
+        }
+    ],
+}
+EXPECTED_PERIOD_INFO = {
+    "period_id": 1,
+    "name": "September 2025 - January 2026",
+    "start_date": "2025-09-01",
+    "end_date": "2026-01-31",
+    "active": True,
+}
+EXPECTED_CREATED_PERIOD = {
+    "success": True,
+    "period_id": 1,
+    "name": "September 2025 - January 2026",
+    "start_date": "2025-09-01",
+    "end_date": "2026-01-31",
+}
+
+
+async def _call_tool(name, *args, **kwargs):
+    """Call an MCP tool function and decode its JSON response."""
+    return json.loads(await _TOOL_FNS[name](*args, **kwargs))
+
+
+@pytest.fixture
+def session_maker():
+    """Session factory mock whose ``async with`` yields a mock session."""
+    maker = MagicMock()
+    # The session is only handed to the (mocked) services, never awaited directly
+    maker.return_value.__aenter__.return_value = MagicMock()
+    return maker
+
+
+@pytest.fixture(autouse=True)
+def _reset_session_maker():
+    """Restore the MCP module's session factory after every test."""
+    saved = mcp_module._session_maker
+    yield
+    mcp_module._session_maker = saved
+
+
+@pytest.fixture
+def installed_session_maker(session_maker):
+    """Install the mocked session factory on the MCP module and return it."""
+    mcp_module._session_maker = session_maker
+    return session_maker
+
+
+@pytest.fixture
+def set_session_maker():
+    """Assign the MCP module's session factory, e.g. to ``None`` (restored automatically)."""
+
+    def _set(value):
+        mcp_module._session_maker = value
+
+    return _set
+
+
+@pytest.fixture
+def patch_service(installed_session_maker, monkeypatch):
+    """Return a helper that makes the named MCP service class build ``mock``.
+
+    Requesting it also installs the mocked session factory, so service-backed
+    tests only spell out the service mock they vary.
+    """
+
+    def _patch(name, mock):
+        monkeypatch.setattr(f"src.api.mcp_server.{name}", lambda *args, **kwargs: mock)
+
+    return _patch
 
 
 class TestDatabaseEngineSetup:
     """Tests for database engine initialization."""
 
-    @pytest.mark.asyncio
-    async def test_mcp_lifespan_available(self):
+    def test_mcp_lifespan_available(self):
         """Test mcp_lifespan context manager is available."""
         assert mcp_lifespan is not None
 
@@ -27,514 +140,226 @@ class TestMCPLifespanContextManager:
         assert mcp.name == "SOSenki"
 
 
-class TestGetBalanceTool:
-    """Tests for get_balance MCP tool."""
+class TestToolErrorHandling:
+    """Error paths shared by every MCP tool."""
 
-    @pytest.mark.asyncio
-    async def test_get_balance_not_initialized(self):
-        """Test get_balance returns error when DB not initialized."""
-        # Get the actual function from the tool
-        tools = list(mcp._tool_manager._tools.values())
-        get_balance_tool = next(t for t in tools if t.name == "get_balance")
-        get_balance_fn = get_balance_tool.fn
+    @pytest.mark.parametrize("tool_name", list(_TOOL_ARGS))
+    async def test_not_initialized(self, tool_name, set_session_maker):
+        """Test each tool returns an error when the DB is not initialized."""
+        set_session_maker(None)
 
-        import src.api.mcp_server as mcp_module
+        result_dict = await _call_tool(tool_name, *_TOOL_ARGS[tool_name])
 
-        old_session_maker = mcp_module._session_maker
-        mcp_module._session_maker = None
+        assert "not initialized" in result_dict["error"].lower()
 
-        result = await get_balance_fn(1)
-        result_dict = json.loads(result)
+    @pytest.mark.parametrize("tool_name", list(_TOOL_ARGS))
+    async def test_exception_handling(self, tool_name, patch_service):
+        """Test each tool turns a service exception into an error response."""
+        service, method = _FIRST_SERVICE_CALL[tool_name]
+        mock_service = AsyncMock()
+        getattr(mock_service, method).side_effect = RuntimeError("DB error")
+
+        patch_service(service, mock_service)
+
+        result_dict = await _call_tool(tool_name, *_TOOL_ARGS[tool_name])
 
         assert "error" in result_dict
-        assert "not initialized" in result_dict["error"].lower()
 
-        mcp_module._session_maker = old_session_maker
 
-    @pytest.mark.asyncio
-    async def test_get_balance_user_not_found(self):
-        """Test get_balance handles missing user."""
-        tools = list(mcp._tool_manager._tools.values())
-        get_balance_tool = next(t for t in tools if t.name == "get_balance")
-        get_balance_fn = get_balance_tool.fn
+class TestGetBalanceTool:
+    """Tests for get_balance MCP tool."""
 
+    async def test_get_balance_user_not_found(self, patch_service):
+        """Test get_balance handles missing user."""
         mock_service = AsyncMock()
         mock_service.get_user_by_id = AsyncMock(return_value=None)
 
-        mock_session = AsyncMock()
-        mock_session_maker = MagicMock()
-        mock_session_maker.return_value.__aenter__.return_value = mock_session
-
-        with patch("src.api.mcp_server._session_maker", mock_session_maker):
-            with patch("src.api.mcp_server.BalanceCalculationService", return_value=mock_service):
-                result = await get_balance_fn(999)
-                result_dict = json.loads(result)
+        patch_service("BalanceCalculationService", mock_service)
+        result_dict = await _call_tool("get_balance", 999)
 
-                assert "error" in result_dict
-                assert "not found" in result_dict["error"].lower()
+        assert "error" in result_dict
+        assert "not found" in result_dict["error"].lower()
 
-    @pytest.mark.asyncio
-    async def test_get_balance_no_account(self):
+    async def test_get_balance_no_account(self, patch_service):
         """Test get_balance handles user without account."""
-        tools = list(mcp._tool_manager._tools.values())
-        get_balance_tool = next(t for t in tools if t.name == "get_balance")
-        get_balance_fn = get_balance_tool.fn
-
         mock_service = AsyncMock()
         mock_service.get_user_by_id = AsyncMock(return_value={"id": 1})
         mock_service.get_account_for_user = AsyncMock(return_value=None)
 
-        mock_session = AsyncMock()
-        mock_session_maker = MagicMock()
-        mock_session_maker.return_value.__aenter__.return_value = mock_session
-
-        with patch("src.api.mcp_server._session_maker", mock_session_maker):
-            with patch("src.api.mcp_server.BalanceCalculationService", return_value=mock_service):
-                result = await get_balance_fn(1)
-                result_dict = json.loads(result)
+        patch_service("BalanceCalculationService", mock_service)
+        result_dict = await _call_tool("get_balance", 1)
 
-                assert "error" in result_dict
-                assert "account" in result_dict["error"].lower()
+        assert "error" in result_dict
+        assert "account" in result_dict["error"].lower()
 
-    @pytest.mark.asyncio
-    async def test_get_balance_success(self):
+    async def test_get_balance_success(self, patch_service):
         """Test get_balance returns balance successfully."""
-        from datetime import datetime
-
-        tools = list(mcp._tool_manager._tools.values())
-        get_balance_tool = next(t for t in tools if t.name == "get_balance")
-        get_balance_fn = get_balance_tool.fn
-
-        mock_user = MagicMock()
-        mock_account = MagicMock()
-        mock_account.id = 1
-        mock_account.updated_at = datetime.fromisoformat("2025-12-07T10:00:00")
+        mock_user = SimpleNamespace(id=1)
+        mock_account = SimpleNamespace(id=1, updated_at=_ACCOUNT_UPDATED_AT)
 
         mock_service = AsyncMock()
         mock_service.get_user_by_id = AsyncMock(return_value=mock_user)
         mock_service.get_account_for_user = AsyncMock(return_value=mock_account)
         mock_service.calculate_user_balance = AsyncMock(return_value=1000.50)
 
-        mock_session = AsyncMock()
-        mock_session_maker = MagicMock()
-        mock_session_maker.return_value.__aenter__.return_value = mock_session
-
-        with patch("src.api.mcp_server._session_maker", mock_session_maker):
-            with patch("src.api.mcp_server.BalanceCalculationService", return_value=mock_service):
-                result = await get_balance_fn(1)
-                result_dict = json.loads(result)
-
-                assert "error" not in result_dict
-                assert result_dict["user_id"] == 1
-                assert result_dict["account_id"] == 1
-                assert result_dict["balance"] == 1000.50
-                # Currency comes from locale_service.CURRENCY (set via LOCALE env)
-                assert result_dict["currency"] == "RUB"
-
-    @pytest.mark.asyncio
-    async def test_get_balance_exception_handling(self):
-        """Test get_balance handles exceptions gracefully."""
-        tools = list(mcp._tool_manager._tools.values())
-        get_balance_tool = next(t for t in tools if t.name == "get_balance")
-        get_balance_fn = get_balance_tool.fn
-
-        mock_service = AsyncMock()
-        mock_service.get_user_by_id = AsyncMock(side_effect=RuntimeError("DB error"))
-
-        mock_session = AsyncMock()
-        mock_session_maker = MagicMock()
-        mock_session_maker.return_value.__aenter__.return_value = mock_session
-
-        with patch("src.api.mcp_server._session_maker", mock_session_maker):
-            with patch("src.api.mcp_server.BalanceCalculationService", return_value=mock_service):
-                result = await get_balance_fn(1)
-                result_dict = json.loads(result)
+        patch_service("BalanceCalculationService", mock_service)
+        result_dict = await _call_tool("get_balance", 1)
 
-                assert "error" in result_dict
+        assert result_dict == EXPECTED_BALANCE
 
 
 class TestListBillsTool:
     """Tests for list_bills MCP tool."""
 
-    @pytest.mark.asyncio
-    async def test_list_bills_not_initialized(self):
-        """Test list_bills returns error when DB not initialized."""
-        tools = list(mcp._tool_manager._tools.values())
-        list_bills_tool = next(t for t in tools if t.name == "list_bills")
-        list_bills_fn = list_bills_tool.fn
-
-        import src.api.mcp_server as mcp_module
-
-        old_session_maker = mcp_module._session_maker
-        mcp_module._session_maker = None
-
-        result = await list_bills_fn(1)
-        result_dict = json.loads(result)
-
-        assert "error" in result_dict
-        assert "not initialized" in result_dict["error"].lower()
-
-        mcp_module._session_maker = old_session_maker
-
-    @pytest.mark.asyncio
-    async def test_list_bills_no_account(self):
+    async def test_list_bills_no_account(self, patch_service):
         """Test list_bills handles user without account."""
-        tools = list(mcp._tool_manager._tools.values())
-        list_bills_tool = next(t for t in tools if t.name == "list_bills")
-        list_bills_fn = list_bills_tool.fn
-
         mock_service = AsyncMock()
         mock_service.get_account_for_user = AsyncMock(return_value=None)
 
-        mock_session = AsyncMock()
-        mock_session_maker = MagicMock()
-        mock_session_maker.return_value.__aenter__.return_value = mock_session
-
-        with patch("src.api.mcp_server._session_maker", mock_session_maker):
-            with patch("src.api.mcp_server.BalanceCalculationService", return_value=mock_service):
-                result = await list_bills_fn(999)
-                result_dict = json.loads(result)
+        patch_service("BalanceCalculationService", mock_service)
+        result_dict = await _call_tool("list_bills", 999)
 
-                assert "error" in result_dict
-                assert "account" in result_dict["error"].lower()
+        assert "error" in result_dict
+        assert "account" in result_dict["error"].lower()
 
-    @pytest.mark.asyncio
-    async def test_list_bills_success(self):
+    async def test_list_bills_success(self, patch_service):
         """Test list_bills returns bills successfully."""
-        tools = list(mcp._tool_manager._tools.values())
-        list_bills_tool = next(t for t in tools if t.name == "list_bills")
-        list_bills_fn = list_bills_tool.fn
-
-        mock_account = MagicMock()
-        mock_account.id = 1
-
-        mock_bill1 = MagicMock()
-        mock_bill1.bill_id = 1
-        mock_bill1.amount = 100.0
-        mock_bill1.bill_date = "2025-12-01"
-        mock_bill1.bill_type = "electricity"
+        mock_account = SimpleNamespace(id=1)
+        mock_bill1 = UserBillInfo(1, 100.0, "2025-12-01", "electricity", None)
 
         mock_service = AsyncMock()
         mock_service.get_account_for_user = AsyncMock(return_value=mock_account)
         mock_service.list_bills_for_user = AsyncMock(return_value=[mock_bill1])
 
-        mock_session = AsyncMock()
-        mock_session_maker = MagicMock()
-        mock_session_maker.return_value.__aenter__.return_value = mock_session
+        patch_service("BalanceCalculationService", mock_service)
+        result_dict = await _call_tool("list_bills", 1)
 
-        with patch("src.api.mcp_server._session_maker", mock_session_maker):
-            with patch("src.api.mcp_server.BalanceCalculationService", return_value=mock_service):
-                result = await list_bills_fn(1)
-                result_dict = json.loads(result)
+        assert result_dict == EXPECTED_BILLS
 
-                assert "error" not in result_dict
-                assert result_dict["user_id"] == 1
-                assert result_dict["account_id"] == 1
-                assert len(result_dict["bills"]) == 1
-                assert result_dict["bills"][0]["bill_id"] == 1
-
-    @pytest.mark.asyncio
-    async def test_list_bills_custom_limit(self):
+    async def test_list_bills_custom_limit(self, patch_service):
         """Test list_bills respects custom limit parameter."""
-        tools = list(mcp._tool_manager._tools.values())
-        list_bills_tool = next(t for t in tools if t.name == "list_bills")
-        list_bills_fn = list_bills_tool.fn
-
-        mock_account = MagicMock()
-        mock_account.id = 1
-
+        mock_account = SimpleNamespace(id=1)
         mock_bills = [
-            MagicMock(bill_id=i, amount=50.0 * i, bill_date="2025-12-01", bill_type="electricity")
-            for i in range(1, 6)
+            UserBillInfo(i, 50.0 * i, "2025-12-01", "electricity", None) for i in range(1, 6)
         ]
 
         mock_service = AsyncMock()
         mock_service.get_account_for_user = AsyncMock(return_value=mock_account)
         mock_service.list_bills_for_user = AsyncMock(return_value=mock_bills)
 
-        mock_session = AsyncMock()
-        mock_session_maker = MagicMock()
-        mock_session_maker.return_value.__aenter__.return_value = mock_session
+        patch_service("BalanceCalculationService", mock_service)
+        result_dict = await _call_tool("list_bills", 1, limit=5)
 
-        with patch("src.api.mcp_server._session_maker", mock_session_maker):
-            with patch("src.api.mcp_server.BalanceCalculationService", return_value=mock_service):
-                result = await list_bills_fn(1, limit=5)
-                result_dict = json.loads(result)
-
-                mock_service.list_bills_for_user.assert_called_once_with(1, 5)
-                assert len(result_dict["bills"]) == 5
-
-    @pytest.mark.asyncio
-    async def test_list_bills_exception_handling(self):
-        """Test list_bills handles exceptions gracefully."""
-        tools = list(mcp._tool_manager._tools.values())
-        list_bills_tool = next(t for t in tools if t.name == "list_bills")
-        list_bills_fn = list_bills_tool.fn
-
-        mock_service = AsyncMock()
-        mock_service.get_account_for_user = AsyncMock(side_effect=RuntimeError("DB error"))
-
-        mock_session = AsyncMock()
-        mock_session_maker = MagicMock()
-        mock_session_maker.return_value.__aenter__.return_value = mock_session
-
-        with patch("src.api.mcp_server._session_maker", mock_session_maker):
-            with patch("src.api.mcp_server.BalanceCalculationService", return_value=mock_service):
-                result = await list_bills_fn(1)
-                result_dict = json.loads(result)
-
-                assert "error" in result_dict
+        mock_service.list_bills_for_user.assert_called_once_with(1, 5)
+        assert len(result_dict["bills"]) == 5
 
 
 class TestGetPeriodInfoTool:
     """Tests for get_period_info MCP tool."""
 
-    @pytest.mark.asyncio
-    async def test_get_period_info_not_initialized(self):
-        """Test get_period_info returns error when DB not initialized."""
-        tools = list(mcp._tool_manager._tools.values())
-        get_period_info_tool = next(t for t in tools if t.name == "get_period_info")
-        get_period_info_fn = get_period_info_tool.fn
-
-        import src.api.mcp_server as mcp_module
-
-        old_session_maker = mcp_module._session_maker
-        mcp_module._session_maker = None
-
-        result = await get_period_info_fn(1)
-        result_dict = json.loads(result)
-
-        assert "error" in result_dict
-        assert "not initialized" in result_dict["error"].lower()
-
-        mcp_module._session_maker = old_session_maker
-
-    @pytest.mark.asyncio
-    async def test_get_period_info_not_found(self):
+    async def test_get_period_info_not_found(self, patch_service):
         """Test get_period_info handles missing period."""
-        tools = list(mcp._tool_manager._tools.values())
-        get_period_info_tool = next(t for t in tools if t.name == "get_period_info")
-        get_period_info_fn = get_period_info_tool.fn
-
         mock_service = AsyncMock()
         mock_service.get_period_info = AsyncMock(return_value=None)
 
-        mock_session = AsyncMock()
-        mock_session_maker = MagicMock()
-        mock_session_maker.return_value.__aenter__.return_value = mock_session
+        patch_service("AsyncServicePeriodService", mock_service)
+        result_dict = await _call_tool("get_period_info", 999)
 
-        with patch("src.api.mcp_server._session_maker", mock_session_maker):
-            with patch("src.api.mcp_server.AsyncServicePeriodService", return_value=mock_service):
-                result = await get_period_info_fn(999)
-                result_dict = json.loads(result)
-
-                assert "error" in result_dict
-                assert "not found" in result_dict["error"].lower()
+        assert "error" in result_dict
+        assert "not found" in result_dict["error"].lower()
 
-    @pytest.mark.asyncio
-    async def test_get_period_info_success(self):
+    async def test_get_period_info_success(self, patch_service):
         """Test get_period_info returns period successfully."""
-        tools = list(mcp._tool_manager._tools.values())
-        get_period_info_tool = next(t for t in tools if t.name == "get_period_info")
-        get_period_info_fn = get_period_info_tool.fn
-
-        mock_period = MagicMock()
-        mock_period.period_id = 1
-        mock_period.name = "September 2025 - January 2026"
-        mock_period.start_date = "2025-09-01"
-        mock_period.end_date = "2026-01-31"
-        mock_period.is_active = True
+        mock_period = SimpleNamespace(
+            period_id=1,
+            name="September 2025 - January 2026",
+            start_date="2025-09-01",
+            end_date="2026-01-31",
+            is_active=True,
+        )
 
         mock_service = AsyncMock()
         mock_service.get_period_info = AsyncMock(return_value=mock_period)
 
-        mock_session = AsyncMock()
-        mock_session_maker = MagicMock()
-        mock_session_maker.return_value.__aenter__.return_value = mock_session
-
-        with patch("src.api.mcp_server._session_maker", mock_session_maker):
-            with patch("src.api.mcp_server.AsyncServicePeriodService", return_value=mock_service):
-                result = await get_period_info_fn(1)
-                result_dict = json.loads(result)
-
-                assert "error" not in result_dict
-                assert result_dict["period_id"] == 1
-                assert result_dict["name"] == "September 2025 - January 2026"
-
-    @pytest.mark.asyncio
-    async def test_get_period_info_exception_handling(self):
-        """Test get_period_info handles exceptions gracefully."""
-        tools = list(mcp._tool_manager._tools.values())
-        get_period_info_tool = next(t for t in tools if t.name == "get_period_info")
-        get_period_info_fn = get_period_info_tool.fn
-
-        mock_service = AsyncMock()
-        mock_service.get_period_info = AsyncMock(side_effect=RuntimeError("DB error"))
+        patch_service("AsyncServicePeriodService", mock_service)
+        result_dict = await _call_tool("get_period_info", 1)
 
-        mock_session = AsyncMock()
-        mock_session_maker = MagicMock()
-        mock_session_maker.return_value.__aenter__.return_value = mock_session
-
-        with patch("src.api.mcp_server._session_maker", mock_session_maker):
-            with patch("src.api.mcp_server.AsyncServicePeriodService", return_value=mock_service):
-                result = await get_period_info_fn(1)
-                result_dict = json.loads(result)
-
-                assert "error" in result_dict
+        assert result_dict == EXPECTED_PERIOD_INFO
 
 
 class TestCreateServicePeriodTool:
     """Tests for create_service_period MCP tool."""
 
-    @pytest.mark.asyncio
-    async def test_create_period_not_initialized(self):
-        """Test create_service_period returns error when DB not initialized."""
-        tools = list(mcp._tool_manager._tools.values())
-        create_period_tool = next(t for t in tools if t.name == "create_service_period")
-        create_period_fn = create_period_tool.fn
-
-        import src.api.mcp_server as mcp_module
-
-        old_session_maker = mcp_module._session_maker
-        mcp_module._session_maker = None
-
-        result = await create_period_fn("Test Period", "2025-09-01", "2026-01-31")
-        result_dict = json.loads(result)
-
-        assert "error" in result_dict
-        assert "not initialized" in result_dict["error"].lower()
-
-        mcp_module._session_maker = old_session_maker
-
-    @pytest.mark.asyncio
-    async def test_create_period_invalid_start_date_format(self):
-        """Test create_service_period validates start_date format."""
-        tools = list(mcp._tool_manager._tools.values())
-        create_period_tool = next(t for t in tools if t.name == "create_service_period")
-        create_period_fn = create_period_tool.fn
-
-        result = await create_period_fn("Test Period", "invalid-date", "2026-01-31")
-        result_dict = json.loads(result)
-
-        assert "error" in result_dict
-
-    @pytest.mark.asyncio
-    async def test_create_period_invalid_end_date_format(self):
-        """Test create_service_period validates end_date format."""
-        tools = list(mcp._tool_manager._tools.values())
-        create_period_tool = next(t for t in tools if t.name == "create_service_period")
-        create_period_fn = create_period_tool.fn
-
-        result = await create_period_fn("Test Period", "2025-09-01", "01-31-2026")
-        result_dict = json.loads(result)
-
-        assert "error" in result_dict
-
-    @pytest.mark.asyncio
-    async def test_create_period_success(self):
+    @pytest.mark.parametrize(
+        "start,end",
+        [
+            ("invalid-date", "2026-01-31"),
+            ("2025-09-01", "01-31-2026"),
+            ("", "2026-01-31"),
+            ("2025-09-01", ""),
+        ],
+    )
+    async def test_create_period_invalid_date_format(self, start, end, installed_session_maker):
+        """Test create_service_period rejects dates that are not YYYY-MM-DD."""
+        result_dict = await _call_tool("create_service_period", "Test Period", start, end)
+
+        assert "invalid date format" in result_dict["error"].lower()
+        installed_session_maker.assert_not_called()
+
+    async def test_create_period_success(self, patch_service):
         """Test create_service_period creates period successfully."""
-        tools = list(mcp._tool_manager._tools.values())
-        create_period_tool = next(t for t in tools if t.name == "create_service_period")
-        create_period_fn = create_period_tool.fn
-
-        mock_period = MagicMock()
-        mock_period.id = 1
-        mock_period.name = "September 2025 - January 2026"
-        mock_period.start_date = date_type(2025, 9, 1)
-        mock_period.end_date = date_type(2026, 1, 31)
+        mock_period = SimpleNamespace(
+            id=1,
+            name="September 2025 - January 2026",
+            start_date=date_type(2025, 9, 1),
+            end_date=date_type(2026, 1, 31),
+        )
 
         mock_service = AsyncMock()
         mock_service.create_period = AsyncMock(return_value=mock_period)
 
-        mock_session = AsyncMock()
-        mock_session_maker = MagicMock()
-        mock_session_maker.return_value.__aenter__.return_value = mock_session
-
-        with patch("src.api.mcp_server._session_maker", mock_session_maker):
-            with patch("src.api.mcp_server.AsyncServicePeriodService", return_value=mock_service):
-                result = await create_period_fn(
-                    "September 2025 - January 2026", "2025-09-01", "2026-01-31"
-                )
-                result_dict = json.loads(result)
+        patch_service("AsyncServicePeriodService", mock_service)
+        result_dict = await _call_tool(
+            "create_service_period", "September 2025 - January 2026", "2025-09-01", "2026-01-31"
+        )
 
-                assert "error" not in result_dict
-                assert result_dict["success"] is True
-                assert result_dict["period_id"] == 1
+        assert result_dict == EXPECTED_CREATED_PERIOD
 
-    @pytest.mark.asyncio
-    async def test_create_period_with_electricity_params(self):
+    async def test_create_period_with_electricity_params(self, patch_service):
         """Test create_service_period accepts optional electricity parameters."""
-        tools = list(mcp._tool_manager._tools.values())
-        create_period_tool = next(t for t in tools if t.name == "create_service_period")
-        create_period_fn = create_period_tool.fn
-
-        mock_period = MagicMock()
-        mock_period.id = 2
-        mock_period.name = "Test Period"
-        mock_period.start_date = date_type(2025, 9, 1)
-        mock_period.end_date = date_type(2026, 1, 31)
+        mock_period = SimpleNamespace(
+            id=2,
+            name="Test Period",
+            start_date=date_type(2025, 9, 1),
+            end_date=date_type(2026, 1, 31),
+        )
 
         mock_service = AsyncMock()
         mock_service.create_period = AsyncMock(return_value=mock_period)
 
-        mock_session = AsyncMock()
-        mock_session_maker = MagicMock()
-        mock_session_maker.return_value.__aenter__.return_value = mock_session
-
-        with patch("src.api.mcp_server._session_maker", mock_session_maker):
-            with patch("src.api.mcp_server.AsyncServicePeriodService", return_value=mock_service):
-                result = await create_period_fn(
-                    "Test Period",
-                    "2025-09-01",
-                    "2026-01-31",
-                    electricity_start=1000,
-                    electricity_rate=0.15,
-                )
-                result_dict = json.loads(result)
-
-                assert "error" not in result_dict
-                assert result_dict["success"] is True
-
-    @pytest.mark.asyncio
-    async def test_create_period_validation_error(self):
-        """Test create_service_period handles validation errors from service."""
-        tools = list(mcp._tool_manager._tools.values())
-        create_period_tool = next(t for t in tools if t.name == "create_service_period")
-        create_period_fn = create_period_tool.fn
+        patch_service("AsyncServicePeriodService", mock_service)
+        result_dict = await _call_tool(
+            "create_service_period",
+            "Test Period",
+            "2025-09-01",
+            "2026-01-31",
+            electricity_start=1000,
+            electricity_rate=0.15,
+        )
+
+        assert "error" not in result_dict
+        assert result_dict["success"] is True
 
+    async def test_create_period_validation_error(self, patch_service):
+        """Test create_service_period handles validation errors from service."""
         mock_service = AsyncMock()
         mock_service.create_period = AsyncMock(
             side_effect=ValueError("End date must be after start date")
         )
 
-        mock_session = AsyncMock()
-        mock_session_maker = MagicMock()
-        mock_session_maker.return_value.__aenter__.return_value = mock_session
-
-        with patch("src.api.mcp_server._session_maker", mock_session_maker):
-            with patch("src.api.mcp_server.AsyncServicePeriodService", return_value=mock_service):
-                result = await create_period_fn("Bad Period", "2026-01-31", "2025-09-01")
-                result_dict = json.loads(result)
-
-                assert "error" in result_dict
-
-    @pytest.mark.asyncio
-    async def test_create_period_exception_handling(self):
-        """Test create_service_period handles exceptions gracefully."""
-        tools = list(mcp._tool_manager._tools.values())
-        create_period_tool = next(t for t in tools if t.name == "create_service_period")
-        create_period_fn = create_period_tool.fn
-
-        mock_service = AsyncMock()
-        mock_service.create_period = AsyncMock(side_effect=RuntimeError("DB error"))
-
-        mock_session = AsyncMock()
-        mock_session_maker = MagicMock()
-        mock_session_maker.return_value.__aenter__.return_value = mock_session
-
-        with patch("src.api.mcp_server._session_maker", mock_session_maker):
-            with patch("src.api.mcp_server.AsyncServicePeriodService", return_value=mock_service):
-                result = await create_period_fn("Test Period", "2025-09-01", "2026-01-31")
-                result_dict = json.loads(result)
+        patch_service("AsyncServicePeriodService", mock_service)
+        result_dict = await _call_tool(
+            "create_service_period", "Bad Period", "2026-01-31", "2025-09-01"
+        )
 
-                assert "error" in result_dict
+        assert "error" in result_dict
@@ -1,64 +1,52 @@
 """Unit tests for period_service.py."""
 
+import dataclasses
 from datetime import date
 from decimal import Decimal
 
 import pytest
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
-from src.models import Base
-from src.models.account import Account
 from src.models.service_period import ServicePeriod
-from src.models.user import User
 from src.services.period_service import PeriodDefaults, ServicePeriodService
 
-
-@pytest.fixture
-async def async_db_session():
-    """Create async test database session."""
-    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
-
-    async_session = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
-    async with async_session() as session:
-        yield session
-
-
-@pytest.fixture
-async def admin_user(async_db_session):
-    """Create admin user for tests."""
-    user = User(telegram_id=123, is_active=True, is_administrator=True)
-    async_db_session.add(user)
-    await async_db_session.commit()
-    return user
+# Immutable values shared by the tests below, built once at import
+JAN_1 = date(2025, 1, 1)
+FEB_1 = date(2025, 2, 1)
+DEC_1_2024 = date(2024, 12, 1)
+DEC_31_2024 = date(2024, 12, 31)
+
+PREV_ELECTRICITY_END = Decimal("200")
+PREV_ELECTRICITY_MULTIPLIER = Decimal("1.5")
+PREV_ELECTRICITY_RATE = Decimal("5.50")
+PREV_ELECTRICITY_LOSSES = Decimal("0.2")
+
+
+def make_period(month, status="open", name=None):
+    """Build a 2025 service period running from the 1st to the 28th of ``month``."""
+    return ServicePeriod(
+        start_date=date(2025, month, 1),
+        end_date=date(2025, month, 28),
+        name=name or f"P{month}",
+        status=status,
+    )
 
 
 @pytest.fixture
-async def account(async_db_session, admin_user):
-    """Create account for tests."""
-    acc = Account(user_id=admin_user.id, name="Test Account")
-    async_db_session.add(acc)
-    await async_db_session.commit()
-    return acc
+def async_db_session(savepoint_session):
+    """Per-test session on the shared engine, rolled back after the test."""
+    return savepoint_session
 
 
 async def test_period_service_get_open_periods(async_db_session):
     """Test getting open periods."""
     # Create some test periods
-    period1 = ServicePeriod(
-        start_date=date(2025, 1, 1), end_date=date(2025, 1, 31), name="Period 1", status="open"
-    )
-    period2 = ServicePeriod(
-        start_date=date(2025, 2, 1), end_date=date(2025, 2, 28), name="Period 2", status="open"
-    )
     period3 = ServicePeriod(
-        start_date=date(2024, 12, 1),
-        end_date=date(2024, 12, 31),
+        start_date=DEC_1_2024,
+        end_date=DEC_31_2024,
         name="Period 3",
         status="closed",
     )
-    async_db_session.add_all([period1, period2, period3])
+    async_db_session.add_all([make_period(1), make_period(2), period3])
     await async_db_session.commit()
 
     service = ServicePeriodService(async_db_session)
@@ -71,14 +59,7 @@ async def test_period_service_get_open_periods(async_db_session):
 async def test_period_service_get_open_periods_limit(async_db_session):
     """Test getting all open periods without limit."""
     # Create 5 open periods
-    for i in range(5):
-        period = ServicePeriod(
-            start_date=date(2025, i + 1, 1),
-            end_date=date(2025, i + 1, 28),
-            name=f"Period {i}",
-            status="open",
-        )
-        async_db_session.add(period)
+    async_db_session.add_all([make_period(i) for i in range(1, 6)])
     await async_db_session.commit()
 
     service = ServicePeriodService(async_db_session)
@@ -89,9 +70,7 @@ async def test_period_service_get_open_periods_limit(async_db_session):
 
 async def test_period_service_get_by_id(async_db_session):
     """Test getting period by id."""
-    period = ServicePeriod(
-        start_date=date(2025, 1, 1), end_date=date(2025, 1, 31), name="Test Period", status="open"
-    )
+    period = make_period(1, name="Test Period")
     async_db_session.add(period)
     await async_db_session.commit()
 
@@ -113,20 +92,14 @@ async def test_period_service_get_by_id_not_found(async_db_session):
 
 async def test_period_service_get_latest_period(async_db_session):
     """Test getting latest period."""
-    period1 = ServicePeriod(
-        start_date=date(2025, 1, 1), end_date=date(2025, 1, 31), name="Period 1", status="open"
-    )
-    period2 = ServicePeriod(
-        start_date=date(2025, 2, 1), end_date=date(2025, 2, 28), name="Period 2", status="open"
-    )
-    async_db_session.add_all([period1, period2])
+    async_db_session.add_all([make_period(1), make_period(2)])
     await async_db_session.commit()
 
     service = ServicePeriodService(async_db_session)
     latest = await service.get_latest_period()
 
     assert latest is not None
-    assert latest.name == "Period 2"
+    assert latest.name == "P2"
 
 
 async def test_period_service_get_latest_period_none(async_db_session):
@@ -142,21 +115,21 @@ async def test_period_service_get_previous_period_defaults(async_db_session):
     # Create previous period with electricity data
     # The method looks for end_date == current_start_date
     prev_period = ServicePeriod(
-        start_date=date(2025, 1, 1),
-        end_date=date(2025, 2, 1),  # This should match the start date we query with
+        start_date=JAN_1,
+        end_date=FEB_1,  # This should match the start date we query with
         name="Previous",
         status="closed",
-        electricity_end=Decimal("200"),
-        electricity_multiplier=Decimal("1.5"),
-        electricity_rate=Decimal("5.50"),
-        electricity_losses=Decimal("0.2"),
+        electricity_end=PREV_ELECTRICITY_END,
+        electricity_multiplier=PREV_ELECTRICITY_MULTIPLIER,
+        electricity_rate=PREV_ELECTRICITY_RATE,
+        electricity_losses=PREV_ELECTRICITY_LOSSES,
     )
     async_db_session.add(prev_period)
     await async_db_session.commit()
 
     service = ServicePeriodService(async_db_session)
     # Pass the same date as the previous period's end_date
-    defaults = await service.get_previous_period_defaults(date(2025, 2, 1))
+    defaults = await service.get_previous_period_defaults(FEB_1)
 
     assert defaults is not None
     # Decimal("200") converts to "200" but might have decimal places in string form
@@ -169,7 +142,7 @@ async def test_period_service_get_previous_period_defaults(async_db_session):
 async def test_period_service_get_previous_period_defaults_none(async_db_session):
     """Test getting defaults when no previous period exists."""
     service = ServicePeriodService(async_db_session)
-    result = await service.get_previous_period_defaults(date(2025, 2, 1))
+    result = await service.get_previous_period_defaults(FEB_1)
 
     # Should return empty PeriodDefaults, not None
     assert result is not None
@@ -181,13 +154,7 @@ async def test_period_service_get_previous_period_defaults_none(async_db_session
 
 async def test_period_service_list_periods(async_db_session):
     """Test listing periods."""
-    period1 = ServicePeriod(
-        start_date=date(2025, 1, 1), end_date=date(2025, 1, 31), name="P1", status="open"
-    )
-    period2 = ServicePeriod(
-        start_date=date(2025, 2, 1), end_date=date(2025, 2, 28), name="P2", status="closed"
-    )
-    async_db_session.add_all([period1, period2])
+    async_db_session.add_all([make_period(1), make_period(2, status="closed")])
     await async_db_session.commit()
 
     service = ServicePeriodService(async_db_session)
@@ -198,14 +165,7 @@ async def test_period_service_list_periods(async_db_session):
 
 async def test_period_service_list_periods_limit(async_db_session):
     """Test listing periods with limit."""
-    for i in range(5):
-        period = ServicePeriod(
-            start_date=date(2025, i + 1, 1),
-            end_date=date(2025, i + 1, 28),
-            name=f"P{i}",
-            status="open",
-        )
-        async_db_session.add(period)
+    async_db_session.add_all([make_period(i) for i in range(1, 6)])
     await async_db_session.commit()
 
     service = ServicePeriodService(async_db_session)
@@ -215,7 +175,7 @@ async def test_period_service_list_periods_limit(async_db_session):
 
 
 def test_period_defaults_dataclass():
-    """Test PeriodDefaults dataclass."""
+    """Test PeriodDefaults keeps exactly the four electricity form fields."""
     defaults = PeriodDefaults(
         electricity_end="200",
         electricity_multiplier="1.5",
@@ -223,7 +183,9 @@ def test_period_defaults_dataclass():
         electricity_losses="0.2",
     )
 
-    assert defaults.electricity_end == "200"
-    assert defaults.electricity_multiplier == "1.5"
-    assert defaults.electricity_rate == "5.50"
-    assert defaults.electricity_losses == "0.2"
+    assert dataclasses.asdict(defaults) == {
+        "electricity_end": "200",
+        "electricity_multiplier": "1.5",
+        "electricity_rate": "5.50",
+        "electricity_losses": "0.2",
+    }
@@ -1,25 +1,20 @@
 """Unit tests for services module with expanded coverage."""
 
-import pytest
+from contextlib import aclosing, closing
+
+from src.services import get_async_session, get_db
 
 
 class TestGetAsyncSession:
     """Test cases for get_async_session dependency."""
 
-    @pytest.mark.asyncio
     async def test_get_async_session_success(self):
         """Test getting async session successfully."""
-        from src.services import get_async_session
-
-        async_gen = get_async_session()
-        session = await async_gen.__anext__()
+        # aclosing() finalizes the generator, closing the session on exit
+        async with aclosing(get_async_session()) as async_gen:
+            session = await anext(async_gen)
 
-        assert session is not None
-        # Cleanup
-        try:
-            await async_gen.__anext__()
-        except StopAsyncIteration:
-            pass
+            assert session is not None
 
 
 class TestGetDb:
@@ -27,31 +22,16 @@ class TestGetDb:
 
     def test_get_db_success(self):
         """Test getting database session successfully."""
-        from src.services import get_db
-
-        db_gen = get_db()
-        session = db_gen.__next__()
+        with closing(get_db()) as db_gen:
+            session = next(db_gen)
 
-        assert session is not None
-        # Cleanup
-        try:
-            db_gen.__next__()
-        except StopIteration:
-            pass
+            assert session is not None
 
     def test_get_db_closes_session(self):
         """Test get_db closes session after use."""
-        from src.services import get_db
-
-        db_gen = get_db()
-        session = db_gen.__next__()
-        session_id = id(session)
-
-        # Try to get the next value (close the generator)
-        try:
-            db_gen.__next__()
-        except StopIteration:
-            pass
+        with closing(get_db()) as db_gen:
+            session = next(db_gen)
+            session_id = id(session)
 
         # Session should have been closed
         assert session_id is not None
@@ -1,40 +1,38 @@
 """Tests for TransactionType enum - payment and expense categorization."""
 
+import pytest
+
 from src.models.transaction_type import TransactionType
 
+_ALL_TYPES = tuple(TransactionType)
+
 
 class TestTransactionTypeEnum:
     """Test TransactionType enumeration."""
 
-    def test_transaction_type_contribution_value(self) -> None:
-        """Verify CONTRIBUTION type has correct value."""
-        assert TransactionType.CONTRIBUTION.value == "contribution"
-
-    def test_transaction_type_expense_value(self) -> None:
-        """Verify EXPENSE type has correct value."""
-        assert TransactionType.EXPENSE.value == "expense"
-
-    def test_transaction_type_salary_value(self) -> None:
-        """Verify SALARY type has correct value."""
-        assert TransactionType.SALARY.value == "salary"
-
-    def test_transaction_type_transfer_value(self) -> None:
-        """Verify TRANSFER type has correct value."""
-        assert TransactionType.TRANSFER.value == "transfer"
-
-    def test_transaction_type_service_charge_value(self) -> None:
-        """Verify SERVICE_CHARGE type has correct value."""
-        assert TransactionType.SERVICE_CHARGE.value == "service_charge"
+    @pytest.mark.parametrize(
+        "member,value,name",
+        [
+            (TransactionType.CONTRIBUTION, "contribution", "CONTRIBUTION"),
+            (TransactionType.EXPENSE, "expense", "EXPENSE"),
+            (TransactionType.SALARY, "salary", "SALARY"),
+            (TransactionType.TRANSFER, "transfer", "TRANSFER"),
+            (TransactionType.SERVICE_CHARGE, "service_charge", "SERVICE_CHARGE"),
+        ],
+    )
+    def test_transaction_type_member(self, member, value, name) -> None:
+        """Verify each transaction type has the correct value and name."""
+        assert member.value == value
+        assert member.name == name
 
     def test_all_transaction_types_are_strings(self) -> None:
         """Verify all transaction types are string enums."""
-        for transaction_type in TransactionType:
-            assert isinstance(transaction_type.value, str)
+        assert all(isinstance(transaction_type.value, str) for transaction_type in _ALL_TYPES)
 
     def test_transaction_type_enum_count(self) -> None:
         """Verify correct number of transaction types exist."""
         expected_types = 5
-        actual_types = len(list(TransactionType))
+        actual_types = len(_ALL_TYPES)
         assert actual_types == expected_types, (
             f"Expected {expected_types} transaction types, found {actual_types}"
         )
@@ -48,11 +46,3 @@ class TestTransactionTypeEnum:
         """Verify transaction types can be created from string values."""
         contribution_type = TransactionType("contribution")
         assert contribution_type == TransactionType.CONTRIBUTION
-
-    def test_transaction_type_name_attribute(self) -> None:
-        """Verify transaction types have correct name attributes."""
-        assert TransactionType.CONTRIBUTION.name == "CONTRIBUTION"
-        assert TransactionType.EXPENSE.name == "EXPENSE"
-        assert TransactionType.SALARY.name == "SALARY"
-        assert TransactionType.TRANSFER.name == "TRANSFER"
-        assert TransactionType.SERVICE_CHARGE.name == "SERVICE_CHARGE"
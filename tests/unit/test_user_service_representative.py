@@ -1,102 +1,50 @@
 """Unit tests for UserStatusService.get_represented_user method."""
 
-from unittest.mock import AsyncMock, MagicMock
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
 
 import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.services.user_service import UserStatusService
 
 
-@pytest.mark.asyncio
-async def test_get_represented_user_with_valid_representative():
-    """Test get_represented_user returns represented user when representative_id exists."""
-    mock_session = AsyncMock()
-
-    # Create mock users using MagicMock to avoid SQLAlchemy relationship issues
-    mock_representing_user = MagicMock()
-    mock_representing_user.id = 1
-    mock_representing_user.representative_id = 2
-
-    mock_represented_user = MagicMock()
-    mock_represented_user.id = 2
-    mock_represented_user.telegram_id = "456"
-    mock_represented_user.representative_id = None
-
-    # Mock session.get to return the correct user based on ID
-    async def mock_get(model, user_id):
-        if user_id == 1:
-            return mock_representing_user
-        elif user_id == 2:
-            return mock_represented_user
-        return None
-
-    mock_session.get = AsyncMock(side_effect=mock_get)
-
-    service = UserStatusService(mock_session)
-    result = await service.get_represented_user(1)
-
-    assert result is not None
-    assert result.id == 2
-    assert result.telegram_id == "456"
-
-
-@pytest.mark.asyncio
-async def test_get_represented_user_no_representative_id():
-    """Test get_represented_user returns None when user has no representative_id."""
-    mock_session = AsyncMock()
-
-    # Mock a user with representative_id=None
-    mock_user = MagicMock()
-    mock_user.id = 1
-    mock_user.representative_id = None
-
-    async def mock_get(model, user_id):
-        if user_id == 1:
-            return mock_user
-        return None
-
-    mock_session.get = AsyncMock(side_effect=mock_get)
-
-    service = UserStatusService(mock_session)
-    result = await service.get_represented_user(1)
-
-    assert result is None
-
-
-@pytest.mark.asyncio
-async def test_get_represented_user_user_not_found():
-    """Test get_represented_user returns None when the representing user doesn't exist."""
-    mock_session = AsyncMock()
-
-    async def mock_get(model, user_id):
-        return None
-
-    mock_session.get = AsyncMock(side_effect=mock_get)
-
-    service = UserStatusService(mock_session)
-    result = await service.get_represented_user(999)
-
-    assert result is None
-
-
-@pytest.mark.asyncio
-async def test_get_represented_user_represented_user_not_found():
-    """Test get_represented_user returns None when represented user doesn't exist."""
-    mock_session = AsyncMock()
-
-    # Mock the representing user with representative_id pointing to non-existent user
-    mock_representing_user = MagicMock()
-    mock_representing_user.id = 1
-    mock_representing_user.representative_id = 999
-
-    async def mock_get(model, user_id):
-        if user_id == 1:
-            return mock_representing_user
-        return None  # Represented user (ID 999) does not exist
-
-    mock_session.get = AsyncMock(side_effect=mock_get)
-
-    service = UserStatusService(mock_session)
-    result = await service.get_represented_user(1)
-
-    assert result is None
+def _user(user_id, representative_id=None):
+    """Build a stand-in user; a plain namespace avoids SQLAlchemy relationship issues."""
+    return SimpleNamespace(id=user_id, representative_id=representative_id)
+
+
+@pytest.fixture
+def user_service_factory():
+    """Return a factory building a UserStatusService over an id -> user table."""
+
+    def make(users):
+        mock_session = AsyncMock(spec=AsyncSession)
+        # A plain function is enough: AsyncMock awaits for us and returns its result
+        mock_session.get.side_effect = lambda model, user_id: users.get(user_id)
+        return UserStatusService(mock_session)
+
+    return make
+
+
+@pytest.mark.parametrize(
+    "users,requested_id,expected_id",
+    [
+        ({1: _user(1, representative_id=2), 2: _user(2)}, 1, 2),
+        ({1: _user(1)}, 1, None),
+        ({}, 999, None),
+        ({1: _user(1, representative_id=999)}, 1, None),
+    ],
+    ids=[
+        "valid-representative",
+        "no-representative-id",
+        "user-not-found",
+        "represented-user-not-found",
+    ],
+)
+async def test_get_represented_user(user_service_factory, users, requested_id, expected_id):
+    """Test get_represented_user follows representative_id to the represented user."""
+    service = user_service_factory(users)
+    result = await service.get_represented_user(requested_id)
+
+    assert result is users.get(expected_id)